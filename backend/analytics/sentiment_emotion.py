@@ -10,10 +10,14 @@ Architecture Decision: Separate analytics into dedicated module to:
 
 import json
 import logging
-from typing import Dict, Any, List, Tuple
-from dataclasses import dataclass, asdict
+import threading
+from typing import Dict, Any, List, Tuple, Optional
+from dataclasses import dataclass, asdict, field
+from collections import deque
 from enum import Enum
 
+from backend.core.keyword_matcher import get_keyword_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +82,132 @@ class EscalationAnalysis:
         return asdict(self)
 
 
+@dataclass
+class SentenceFeatures:
+    """Keyword features of a single sentence, computed once and shared by all analyzers"""
+    sentiment_score: float  # -1.0 to 1.0
+    emotion_scores: Dict[str, float]  # emotion -> score (0-100)
+    primary_emotion: str
+    emotional_intensity: float  # 0-100
+
+
+def split_sentences(text: str) -> List[str]:
+    """Shared sentence segmentation used for trajectory, peaks and transitions"""
+    return [s for s in text.split(".") if s.strip()]
+
+
+def _trend(values: deque, threshold: float) -> str:
+    """Compare the recent half of a window with the earlier half"""
+    if len(values) < 2:
+        return "stable"
+    items = list(values)
+    half = len(items) // 2
+    earlier = sum(items[:half]) / half
+    recent = sum(items[half:]) / (len(items) - half)
+    if recent - earlier > threshold:
+        return "improving"
+    if earlier - recent > threshold:
+        return "declining"
+    return "stable"
+
+
+@dataclass
+class ConversationSentimentState:
+    """
+    Running sentiment/emotion aggregates for one conversation.
+    Each segment's per-sentence features are folded in once, so a
+    conversation-level snapshot never requires rescanning earlier segments.
+    Windows are bounded to keep memory flat for long calls.
+    Callers folding from several threads hold `lock` around fold and snapshot.
+    """
+    TRAJECTORY_WINDOW = 200
+    TREND_WINDOW = 10
+    MAX_PEAKS = 5
+    MAX_TRANSITIONS = 20
+    
+    segments: int = 0
+    sentences: int = 0
+    sentiment_sum: float = 0.0
+    trajectory: deque = field(default_factory=lambda: deque(maxlen=ConversationSentimentState.TRAJECTORY_WINDOW))
+    emotion_totals: Dict[str, float] = field(default_factory=dict)
+    peaks: deque = field(default_factory=lambda: deque(maxlen=ConversationSentimentState.MAX_PEAKS))
+    transitions: deque = field(default_factory=lambda: deque(maxlen=ConversationSentimentState.MAX_TRANSITIONS))
+    last_emotion: Optional[str] = None
+    escalation_risks: deque = field(default_factory=lambda: deque(maxlen=ConversationSentimentState.TREND_WINDOW))
+    escalation_sum: float = 0.0
+    peak_escalation_risk: float = 0.0
+    customer_scores: deque = field(default_factory=lambda: deque(maxlen=ConversationSentimentState.TREND_WINDOW))
+    agent_scores: deque = field(default_factory=lambda: deque(maxlen=ConversationSentimentState.TREND_WINDOW))
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    
+    def fold(self,
+             sentence_features: List["SentenceFeatures"],
+             escalation_risk: float,
+             customer_score: Optional[float] = None,
+             agent_score: Optional[float] = None) -> None:
+        """Fold one segment into the running aggregates (O(segment))"""
+        self.segments += 1
+        for features in sentence_features:
+            self.sentiment_sum += features.sentiment_score
+            self.trajectory.append(features.sentiment_score)
+            for emotion, score in features.emotion_scores.items():
+                self.emotion_totals[emotion] = self.emotion_totals.get(emotion, 0.0) + score
+            if features.emotional_intensity > 40:
+                self.peaks.append((self.sentences, features.primary_emotion))
+            # Sentences without emotion keywords don't break an emotional run
+            if features.emotional_intensity > 0:
+                if self.last_emotion and self.last_emotion != features.primary_emotion:
+                    self.transitions.append(f"{self.last_emotion} → {features.primary_emotion}")
+                self.last_emotion = features.primary_emotion
+            self.sentences += 1
+        
+        self.escalation_risks.append(escalation_risk)
+        self.escalation_sum += escalation_risk
+        self.peak_escalation_risk = max(self.peak_escalation_risk, escalation_risk)
+        if customer_score is not None:
+            self.customer_scores.append(customer_score)
+        if agent_score is not None:
+            self.agent_scores.append(agent_score)
+    
+    def customer_trend(self) -> str:
+        return _trend(self.customer_scores, 0.2)
+    
+    def agent_trend(self) -> str:
+        return _trend(self.agent_scores, 0.2)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Conversation-level view of everything folded in so far"""
+        emotion_total = sum(self.emotion_totals.values())
+        distribution = {
+            emotion: round(score / emotion_total, 3) if emotion_total else 0.0
+            for emotion, score in self.emotion_totals.items()
+        }
+        dominant = max(self.emotion_totals, key=self.emotion_totals.get) if emotion_total else None
+        # Escalation risk rising means the conversation is getting worse
+        escalation_trend = {"improving": "rising", "declining": "falling"}.get(
+            _trend(self.escalation_risks, 10.0), "stable"
+        )
+        
+        return {
+            "segments": self.segments,
+            "sentences": self.sentences,
+            "average_sentiment": round(self.sentiment_sum / self.sentences, 3) if self.sentences else 0.0,
+            "sentiment_trajectory": list(self.trajectory),
+            "emotion_distribution": distribution,
+            "dominant_emotion": dominant,
+            "emotional_peaks": list(self.peaks),
+            "emotion_transitions": list(self.transitions),
+            "escalation": {
+                "current_risk": self.escalation_risks[-1] if self.escalation_risks else 0.0,
+                "peak_risk": self.peak_escalation_risk,
+                "average_risk": round(self.escalation_sum / self.segments, 1) if self.segments else 0.0,
+                "trend": escalation_trend,
+            },
+            "customer_sentiment_trend": self.customer_trend(),
+            "agent_sentiment_trend": self.agent_trend(),
+        }
+
+
 class SentimentAnalyzer:
     """Analyzes sentiment of conversation text"""
     
@@ -90,19 +220,44 @@ class SentimentAnalyzer:
             "negative": ["bad", "poor", "upset", "frustrated", "disappointed", "unhappy"],
             "very_negative": ["hate", "terrible", "awful", "disgusted", "furious", "worst", "unacceptable"]
         }
+        self.sentiment_vocabulary = frozenset(
+            kw for kws in self.sentiment_keywords.values() for kw in kws
+        )
+        self.matcher = get_keyword_matcher()
+        self.matcher.register("sentiment", self.sentiment_keywords)
     
-    def analyze(self, text: str, depth: int = 0) -> SentimentResult:
+    def analyze(self, text: str, depth: int = 0,
+                sentence_features: Optional[List[SentenceFeatures]] = None) -> SentimentResult:
         """
         Analyze overall sentiment of text.
         Method: Keyword-based with LLM validation (can be upgraded with transformers)
+        
+        Args:
+            text: Text to analyze
+            depth: 0 for full analysis, 1 to skip the per-sentence trajectory
+            sentence_features: Precomputed per-sentence features of text, if available
         """
-        text_lower = text.lower()
+        overall, score = self.score_hits(self.matcher.scan(text))
         
+        # Extract sentiment phrases
+        phrases = self._extract_sentiment_phrases(text)
+        
+        trajectory = self._calculate_trajectory(text, sentence_features) if depth == 0 else []
+        
+        return SentimentResult(
+            overall_sentiment=overall.value,
+            sentiment_score=score,
+            confidence=0.8,  # Can be improved with ML model
+            sentiment_trajectory=trajectory,
+            key_sentiment_phrases=phrases
+        )
+    
+    def score_hits(self, hits) -> Tuple[SentimentCategory, float]:
+        """Classify sentiment from one keyword scan"""
         # Count sentiment keywords
         scores = {}
-        for sentiment, keywords in self.sentiment_keywords.items():
-            count = sum(1 for kw in keywords if kw in text_lower)
-            scores[sentiment] = count
+        for sentiment in self.sentiment_keywords:
+            scores[sentiment] = hits.count("sentiment", sentiment)
         
         # Determine overall sentiment
         if scores["very_positive"] > 0:
@@ -121,18 +276,7 @@ class SentimentAnalyzer:
             overall = SentimentCategory.NEUTRAL
             score = 0.0
         
-        # Extract sentiment phrases
-        phrases = self._extract_sentiment_phrases(text)
-        
-        trajectory = self._calculate_trajectory(text) if depth == 0 else []
-        
-        return SentimentResult(
-            overall_sentiment=overall.value,
-            sentiment_score=score,
-            confidence=0.8,  # Can be improved with ML model
-            sentiment_trajectory=trajectory,
-            key_sentiment_phrases=phrases
-        )
+        return overall, score
     
     def _extract_sentiment_phrases(self, text: str, window: int = 5) -> List[str]:
         """Extract phrases around sentiment keywords"""
@@ -140,7 +284,7 @@ class SentimentAnalyzer:
         words = text.split()
         
         for i, word in enumerate(words):
-            if any(word.lower() == kw for kws in self.sentiment_keywords.values() for kw in kws):
+            if word.lower() in self.sentiment_vocabulary:
                 start = max(0, i - window)
                 end = min(len(words), i + window + 1)
                 phrase = " ".join(words[start:end])
@@ -148,18 +292,19 @@ class SentimentAnalyzer:
         
         return phrases[:5]  # Return top 5
     
-    def _calculate_trajectory(self, text: str) -> List[float]:
+    def _calculate_trajectory(self, text: str,
+                              sentence_features: Optional[List[SentenceFeatures]] = None) -> List[float]:
         """Calculate sentiment score progression through conversation"""
-        chunks = [c for c in text.split(".") if c.strip()]
+        if sentence_features is not None:
+            if len(sentence_features) <= 1:
+                return []
+            return [f.sentiment_score for f in sentence_features]
+        
+        chunks = split_sentences(text)
         if len(chunks) <= 1:
             return []
-            
-        trajectory = []
-        for chunk in chunks:
-            result = self.analyze(chunk, depth=1)
-            trajectory.append(result.sentiment_score)
         
-        return trajectory
+        return [self.score_hits(self.matcher.scan(chunk, use_cache=False))[1] for chunk in chunks]
 
 
 class EmotionDetector:
@@ -177,18 +322,46 @@ class EmotionDetector:
             EmotionType.FRUSTRATION: ["frustrated", "annoyed", "irritated", "exasperated"],
             EmotionType.CONFUSION: ["confused", "lost", "unclear", "don't understand", "puzzled"]
         }
+        self.matcher = get_keyword_matcher()
+        self.matcher.register("emotion", {e.value: kws for e, kws in self.emotion_indicators.items()})
     
-    def analyze(self, text: str, depth: int = 0) -> EmotionResult:
+    def analyze(self, text: str, depth: int = 0,
+                sentence_features: Optional[List[SentenceFeatures]] = None) -> EmotionResult:
         """
         Detect emotions in text.
         Returns emotional intensity and emotion distribution.
+        
+        Args:
+            text: Text to analyze
+            depth: 0 for full analysis, 1 to skip per-sentence peaks and transitions
+            sentence_features: Precomputed per-sentence features of text, if available
         """
-        text_lower = text.lower()
+        emotion_scores, primary, intensity = self.score_hits(self.matcher.scan(text))
+        
+        # Peaks and transitions share one per-sentence pass
+        peaks = []
+        transitions = []
+        if depth == 0:
+            if sentence_features is None:
+                sentence_features = self._sentence_emotions(text)
+            peaks = self._find_peaks(sentence_features)
+            transitions = self._find_transitions(sentence_features)
+        
+        return EmotionResult(
+            primary_emotion=primary,
+            emotion_scores=emotion_scores,
+            emotional_intensity=intensity,
+            emotional_peaks=peaks,
+            emotion_transitions=transitions
+        )
+    
+    def score_hits(self, hits) -> Tuple[Dict[str, float], str, float]:
+        """Emotion distribution, primary emotion and intensity from one keyword scan"""
         emotion_scores = {}
         
         # Score each emotion
-        for emotion, indicators in self.emotion_indicators.items():
-            count = sum(1 for indicator in indicators if indicator in text_lower)
+        for emotion in self.emotion_indicators:
+            count = hits.count("emotion", emotion.value)
             emotion_scores[emotion.value] = min(100, count * 20)  # Scale to 0-100
         
         # Find primary emotion
@@ -197,47 +370,41 @@ class EmotionDetector:
         # Calculate overall intensity
         intensity = sum(emotion_scores.values()) / len(emotion_scores)
         
-        # Only find peaks and transitions at top level to avoid infinite recursion
-        peaks = self._find_peaks(text) if depth == 0 else []
-        transitions = self._find_transitions(text) if depth == 0 else []
-        
-        return EmotionResult(
-            primary_emotion=primary,
-            emotion_scores=emotion_scores,
-            emotional_intensity=intensity,
-            emotional_peaks=peaks,
-            emotion_transitions=transitions
-        )
+        return emotion_scores, primary, intensity
+    
+    def _sentence_emotions(self, text: str) -> List[SentenceFeatures]:
+        """Emotion-only sentence features when no shared pass was provided"""
+        features = []
+        for sentence in split_sentences(text):
+            scores, primary, intensity = self.score_hits(self.matcher.scan(sentence, use_cache=False))
+            features.append(SentenceFeatures(0.0, scores, primary, intensity))
+        return features
     
-    def _find_peaks(self, text: str) -> List[Tuple[int, str]]:
+    def _find_peaks(self, sentence_features: List[SentenceFeatures]) -> List[Tuple[int, str]]:
         """Find points of maximum emotional intensity"""
-        sentences = [s for s in text.split(".") if s.strip()]
         # If text has no periods, it's just one sentence. Skip to avoid redundancy.
-        if len(sentences) <= 1:
+        if len(sentence_features) <= 1:
             return []
-            
+        
         peaks = []
-        for i, sentence in enumerate(sentences):
-            result = self.analyze(sentence, depth=1)
-            if result.emotional_intensity > 40:
-                peaks.append((i, result.primary_emotion))
+        for i, features in enumerate(sentence_features):
+            if features.emotional_intensity > 40:
+                peaks.append((i, features.primary_emotion))
         
         return peaks[:5]
     
-    def _find_transitions(self, text: str) -> List[str]:
+    def _find_transitions(self, sentence_features: List[SentenceFeatures]) -> List[str]:
         """Find transitions between different emotions"""
-        sentences = [s for s in text.split(".") if s.strip()]
-        if len(sentences) <= 1:
+        if len(sentence_features) <= 1:
             return []
-            
+        
         transitions = []
         prev_emotion = None
         
-        for sentence in sentences:
-            result = self.analyze(sentence, depth=1)
-            if prev_emotion and prev_emotion != result.primary_emotion:
-                transitions.append(f"{prev_emotion} → {result.primary_emotion}")
-            prev_emotion = result.primary_emotion
+        for features in sentence_features:
+            if prev_emotion and prev_emotion != features.primary_emotion:
+                transitions.append(f"{prev_emotion} → {features.primary_emotion}")
+            prev_emotion = features.primary_emotion
         
         return transitions
 
@@ -253,16 +420,24 @@ class EscalationDetector:
             "unfair", "unacceptable", "ridiculous", "lawsuit", "complaint",
             "management", "supervisor", "escalate", "demand", "refuse"
         ]
+        self.matcher = get_keyword_matcher()
+        self.matcher.register("escalation", {"keywords": self.escalation_keywords})
     
-    def analyze(self, text: str) -> EscalationAnalysis:
+    def analyze(self, text: str,
+                sentiment: Optional[SentimentResult] = None,
+                emotion: Optional[EmotionResult] = None) -> EscalationAnalysis:
         """
         Analyze escalation risk in conversation.
         High risk: negative sentiment + escalation keywords + high intensity
+        
+        Pass the sentiment and emotion results already computed for text to
+        avoid analyzing it again; only whole-text scores are needed here.
         """
-        sentiment = self.sentiment_analyzer.analyze(text)
-        emotion = self.emotion_detector.analyze(text)
+        if sentiment is None:
+            sentiment = self.sentiment_analyzer.analyze(text, depth=1)
+        if emotion is None:
+            emotion = self.emotion_detector.analyze(text, depth=1)
         
-        text_lower = text.lower()
         escalation_score = 0.0
         indicators = []
         
@@ -272,7 +447,7 @@ class EscalationDetector:
             indicators.append("Negative sentiment detected")
         
         # Check for escalation keywords
-        keyword_count = sum(1 for kw in self.escalation_keywords if kw in text_lower)
+        keyword_count = self.matcher.scan(text).count("escalation", "keywords")
         escalation_score += keyword_count * 15
         if keyword_count > 0:
             indicators.append(f"{keyword_count} escalation keyword(s) detected")
@@ -308,16 +483,59 @@ class SentimentEmotionAnalyzer:
         self.emotion = EmotionDetector()
         self.escalation = EscalationDetector(self.sentiment, self.emotion)
     
+    def extract_sentence_features(self, text: str) -> List[SentenceFeatures]:
+        """
+        Segment text once and compute every sentence's features in a single
+        keyword scan per sentence (sentiment and emotion share the automaton).
+        """
+        features = []
+        for sentence in split_sentences(text):
+            hits = self.sentiment.matcher.scan(sentence, use_cache=False)
+            _, sentiment_score = self.sentiment.score_hits(hits)
+            emotion_scores, primary, intensity = self.emotion.score_hits(hits)
+            features.append(SentenceFeatures(sentiment_score, emotion_scores, primary, intensity))
+        return features
+    
     def comprehensive_analysis(self, text: str) -> Dict[str, Any]:
         """
         Perform comprehensive sentiment, emotion, and escalation analysis.
         Returns JSON-serializable results.
         """
-        sentiment_result = self.sentiment.analyze(text)
-        emotion_result = self.emotion.analyze(text)
-        escalation_result = self.escalation.analyze(text)
+        return self._analyze(text)[1]
+    
+    def analyze_segment(self,
+                        state: ConversationSentimentState,
+                        text: str,
+                        agent_text: Optional[str] = None,
+                        customer_text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Analyze one streaming segment and fold it into its conversation state.
+        Returns the per-segment analysis, with speaker trends taken from the
+        conversation history and a "conversation" snapshot attached.
+        """
+        sentence_features, result = self._analyze(text)
+        customer_score = self.sentiment.score_hits(self.sentiment.matcher.scan(customer_text))[1] \
+            if customer_text else None
+        agent_score = self.sentiment.score_hits(self.sentiment.matcher.scan(agent_text))[1] \
+            if agent_text else None
+        with state.lock:
+            state.fold(sentence_features, result["escalation"]["escalation_risk"], customer_score, agent_score)
+            
+            if customer_score is not None:
+                result["escalation"]["customer_sentiment_trend"] = state.customer_trend()
+            if agent_score is not None:
+                result["escalation"]["agent_sentiment_trend"] = state.agent_trend()
+            result["conversation"] = state.snapshot()
+        return result
+    
+    def _analyze(self, text: str) -> Tuple[List[SentenceFeatures], Dict[str, Any]]:
+        """Shared per-sentence pass plus the formatted analysis"""
+        sentence_features = self.extract_sentence_features(text)
+        sentiment_result = self.sentiment.analyze(text, sentence_features=sentence_features)
+        emotion_result = self.emotion.analyze(text, sentence_features=sentence_features)
+        escalation_result = self.escalation.analyze(text, sentiment_result, emotion_result)
         
-        return {
+        return sentence_features, {
             "sentiment": sentiment_result.to_dict(),
             "emotion": emotion_result.to_dict(),
             "escalation": escalation_result.to_dict(),
@@ -11,14 +11,15 @@ Architecture:
 
 import os
 import json
+import asyncio
 import logging
 from typing import Dict, Optional, Any, List
 from datetime import datetime
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
 
 # Import audit service and supporting modules
@@ -26,7 +27,9 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from backend.auditor_service import EnterpriseQualityAuditorService
 from backend.core.pii_masking import get_masking_pipeline
-from backend.core.multilingual_transcribe import get_transcription_engine
+from backend.core.transcription_pool import (
+    get_transcription_pool, TranscriptionQueueFullError, TranscriptionTimeoutError
+)
 
 # Setup logging
 logging.basicConfig(
@@ -41,7 +44,7 @@ logger = logging.getLogger(__name__)
 # Global instances
 audit_service: Optional[EnterpriseQualityAuditorService] = None
 masking_pipeline = get_masking_pipeline(enable_ner=True)
-transcription_engine = get_transcription_engine(whisper_model="tiny", auto_translate=True)
+transcription_pool = get_transcription_pool(whisper_model="tiny", auto_translate=True)
 
 
 @asynccontextmanager
@@ -65,10 +68,26 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Failed to initialize audit service: {e}")
         raise
     
+    try:
+        transcription_pool.start()
+    except Exception as e:
+        logger.error(f"❌ Transcription workers unavailable: {e}")
+    
+    # Finalize realtime sessions whose clients disappeared without ending them
+    reaper = asyncio.create_task(audit_service.streaming_engine.run_session_reaper(
+        interval=float(os.getenv("AUDIT_REAPER_INTERVAL", "30"))
+    ))
+    
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down AI Quality Auditor Service...")
+    reaper.cancel()
+    transcription_pool.shutdown(wait=False)
+    if audit_service.streaming_engine.quality_batcher:
+        await audit_service.streaming_engine.quality_batcher.aclose()
+    if audit_service.llm_manager:
+        await audit_service.llm_manager.aclose()
     audit_service = None
     logger.info("✅ Service shutdown complete")
 
@@ -124,7 +143,9 @@ async def health_check():
         "timestamp": datetime.now().isoformat(),
         "uptime_seconds": (datetime.now() - audit_service.service_start_time).total_seconds(),
         "total_conversations": audit_service.total_conversations,
-        "total_segments": audit_service.total_segments
+        "total_segments": audit_service.total_segments,
+        "transcription": transcription_pool.stats(),
+        "sessions": audit_service.streaming_engine.session_gauges()
     }
 
 
@@ -139,27 +160,20 @@ async def transcribe_audio(file: UploadFile = File(...)):
     Returns: Transcript with detected language and confidence
     """
     import tempfile
-    import asyncio
     
+    temp_path = None
     try:
-        # Save uploaded file to OS-appropriate temp directory
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, file.filename)
-        
-        with open(temp_path, "wb") as f:
+        # Save upload under a unique temp name so concurrent uploads don't collide
+        suffix = os.path.splitext(file.filename or "")[1]
+        fd, temp_path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "wb") as f:
             content = await file.read()
             f.write(content)
         
         logger.info(f"Audio file saved to {temp_path} ({len(content)} bytes)")
         
-        # Run transcription in thread pool to avoid blocking the event loop
-        result = await asyncio.to_thread(
-            transcription_engine.transcribe_and_process, temp_path
-        )
-        
-        # Cleanup
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        # Transcribe on the worker pool (long files are split across workers)
+        result = await transcription_pool.transcribe(temp_path)
         
         return {
             "success": True,
@@ -167,9 +181,86 @@ async def transcribe_audio(file: UploadFile = File(...)):
             "timestamp": datetime.now().isoformat()
         }
     
+    except TranscriptionQueueFullError as e:
+        logger.warning(f"Transcription rejected: {e}")
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "10"})
+    except TranscriptionTimeoutError as e:
+        logger.error(f"Transcription timeout: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Transcription error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        # Cleanup
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+@app.post("/transcribe/stream", tags=["Transcription"])
+async def transcribe_audio_stream(file: UploadFile = File(...)):
+    """
+    Transcribe a long audio file in overlapping chunks across the worker pool.
+    
+    Streams newline-delimited JSON: one {"type": "partial"} line per chunk, in
+    order, as soon as it is ready, then a {"type": "final"} line with the
+    stitched transcript. Errors after the stream starts arrive as {"type": "error"}.
+    """
+    import tempfile
+    from backend.core.multilingual_transcribe import probe_audio_duration
+    
+    suffix = os.path.splitext(file.filename or "")[1]
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, "wb") as f:
+        content = await file.read()
+        f.write(content)
+    logger.info(f"Audio file saved to {temp_path} ({len(content)} bytes) for chunked transcription")
+    
+    duration = await asyncio.to_thread(probe_audio_duration, temp_path)
+    chunks = transcription_pool.transcribe_chunked(temp_path, duration)
+    try:
+        # Start the first chunk before responding so "busy" is still a 429
+        first = await chunks.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except Exception as e:
+        await chunks.aclose()
+        os.remove(temp_path)
+        if isinstance(e, TranscriptionQueueFullError):
+            logger.warning(f"Transcription rejected: {e}")
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "10"})
+        if isinstance(e, TranscriptionTimeoutError):
+            logger.error(f"Transcription timeout: {e}")
+            raise HTTPException(status_code=504, detail=str(e))
+        logger.error(f"Transcription error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async def stream():
+        partials = []
+        try:
+            if first is not None:
+                partials.append(first)
+                yield json.dumps({"type": "partial", "index": 0, "data": first.to_dict(),
+                                  "start_seconds": first.start_offset_seconds}) + "\n"
+            async for partial in chunks:
+                partials.append(partial)
+                yield json.dumps({"type": "partial", "index": len(partials) - 1, "data": partial.to_dict(),
+                                  "start_seconds": partial.start_offset_seconds}) + "\n"
+            yield json.dumps({
+                "type": "final",
+                "transcript": " ".join(p.transcript for p in partials if p.transcript),
+                "duration_seconds": duration,
+                "chunks": len(partials),
+                "timestamp": datetime.now().isoformat()
+            }) + "\n"
+        except Exception as e:
+            logger.error(f"Chunked transcription error: {e}")
+            yield json.dumps({"type": "error", "detail": str(e)}) + "\n"
+        finally:
+            await chunks.aclose()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
 
 # ==================== PII MASKING ENDPOINTS ====================
@@ -191,7 +282,7 @@ async def mask_pii(request: Dict[str, str]):
         if not text:
             raise ValueError("Text field is required")
         
-        result = masking_pipeline.masker.mask(text)
+        result = masking_pipeline.mask(text)
         
         return {
             "success": True,
@@ -235,23 +326,15 @@ async def batch_audit(request: Dict[str, Any]):
         if not transcript:
             raise ValueError("Transcript is required")
         
-        # Step 1: Mask PII
-        masked_transcript = masking_pipeline.process_for_llm(transcript)
-        
-        # Step 2: Force-clean any existing conversation state
-        if conversation_id in audit_service.streaming_engine.active_conversations:
-            audit_service.streaming_engine.active_conversations.pop(conversation_id)
-        # Clear stale audit results for this conversation
-        audit_service.streaming_engine.audit_results = [
-            r for r in audit_service.streaming_engine.audit_results
-            if not r.segment_id.startswith(conversation_id)
-        ]
+        # Step 1: Force-clean any existing conversation state
+        audit_service.streaming_engine.discard_conversation(conversation_id)
         
         # Start fresh audit
         audit_service.start_realtime_audit(conversation_id, agent_id)
         
-        # Step 3: Parse transcript into conversation turns
+        # Step 2: Parse transcript into conversation turns
         lines = transcript.split('\n')
+        turns = []
         agent_msg = ""
         customer_msg = ""
         
@@ -259,16 +342,11 @@ async def batch_audit(request: Dict[str, Any]):
             line = line.strip()
             if not line:
                 continue
-                
+            
             if line.lower().startswith("agent:"):
-                # Process pending turn
+                # Close pending turn
                 if agent_msg or customer_msg:
-                    audit_service.process_realtime_segment(
-                        conversation_id,
-                        agent_message=agent_msg.strip(),
-                        customer_message=customer_msg.strip(),
-                        agent_id=agent_id
-                    )
+                    turns.append((agent_msg.strip(), customer_msg.strip()))
                     agent_msg = ""
                     customer_msg = ""
                 # Start new agent msg
@@ -281,13 +359,18 @@ async def batch_audit(request: Dict[str, Any]):
                     customer_msg += " " + line
                 else:
                     agent_msg += " " + line
-                    
-        # Process the final turn
+        
+        # Close the final turn
         if agent_msg or customer_msg:
-            audit_service.process_realtime_segment(
+            turns.append((agent_msg.strip(), customer_msg.strip()))
+        
+        # Step 3: Mask PII in every message with one batched NER pass, then audit turn by turn
+        masked = [r.masked_text for r in masking_pipeline.mask_many([m for turn in turns for m in turn])]
+        for i in range(len(turns)):
+            await audit_service.process_realtime_segment_async(
                 conversation_id,
-                agent_message=agent_msg.strip(),
-                customer_message=customer_msg.strip(),
+                agent_message=masked[2 * i],
+                customer_message=masked[2 * i + 1],
                 agent_id=agent_id
             )
         
@@ -303,15 +386,8 @@ async def batch_audit(request: Dict[str, Any]):
         resolution = int(metrics.get("resolution_avg", 0))
         compliance = int(metrics.get("compliance_avg", 0))
         
-        # Extract escalation risk from the latest audit result
-        escalation_risk = 0
-        try:
-            conv_results = [r for r in audit_service.streaming_engine.audit_results
-                           if r.segment_id.startswith(conversation_id)]
-            if conv_results:
-                escalation_risk = conv_results[-1].quality_score.get("escalation_risk", 0)
-        except Exception:
-            pass
+        # Escalation risk of the latest segment
+        escalation_risk = final_report.get("escalation_risk", 0)
         
         return {
             "success": True,
@@ -390,7 +466,7 @@ async def websocket_realtime_audit(websocket: WebSocket):
     1. Client connects: /ws/realtime?conversation_id=xxx
     2. Client sends: {"agent": "...", "customer": "..."}
     3. Server responds: {"scores": {...}, "alerts": [...]}
-    4. Client closes to end session
+    4. Client closes to end session (the session is finalized on disconnect)
     
     Message format (incoming):
     {
@@ -410,16 +486,21 @@ async def websocket_realtime_audit(websocket: WebSocket):
         await websocket.close(code=1008, reason="Service not initialized")
         return
     
+    # Extract conversation_id from query params
+    conversation_id = websocket.query_params.get("conversation_id", f"ws_{datetime.now().timestamp()}")
+    agent_id = websocket.query_params.get("agent_id", "unknown")
+    engine = audit_service.streaming_engine
+    
     try:
         await websocket.accept()
         
-        # Extract conversation_id from query params
-        conversation_id = websocket.query_params.get("conversation_id", f"ws_{datetime.now().timestamp()}")
-        agent_id = websocket.query_params.get("agent_id", "unknown")
-        
         logger.info(f"WebSocket connected: {conversation_id}")
         
-        # Start audit session
+        # Start audit session, unless one with this id is already running (e.g. started
+        # over REST or by another socket); disconnecting always finalizes it, so a
+        # reconnect after that starts a fresh session
+        if conversation_id not in engine.active_conversations:
+            audit_service.start_realtime_audit(conversation_id, agent_id)
         await websocket.send_json({
             "type": "session_started",
             "conversation_id": conversation_id,
@@ -437,28 +518,37 @@ async def websocket_realtime_audit(websocket: WebSocket):
             if not agent_message and not customer_message:
                 continue
             
-            # Mask PII before processing
-            agent_message = masking_pipeline.process_for_llm(agent_message)
-            customer_message = masking_pipeline.process_for_llm(customer_message)
+            # Mask PII before processing (both sides in one NER batch)
+            agent_message, customer_message = [
+                r.masked_text for r in masking_pipeline.mask_many([agent_message, customer_message])
+            ]
+            
+            # The session may have been reaped or evicted while the socket sat idle
+            if conversation_id not in engine.active_conversations:
+                audit_service.start_realtime_audit(conversation_id, agent_id)
             
             # Process segment
-            result = audit_service.process_realtime_segment(
+            result = await audit_service.process_realtime_segment_async(
                 conversation_id,
                 agent_message=agent_message,
                 customer_message=customer_message,
                 agent_id=agent_id
             )
+            analysis = result.get("analysis", {})
+            quality = analysis.get("quality", {})
             
             # Send back results
             await websocket.send_json({
                 "type": "segment_processed",
-                "scores": result.get("scores", {}),
-                "compliance": result.get("compliance", "UNKNOWN"),
-                "alerts": result.get("alerts", []),
-                "suggestions": result.get("suggestions", []),
+                "scores": quality,
+                "compliance": quality.get("compliance_status", "UNKNOWN").upper(),
+                "alerts": analysis.get("warnings", []),
+                "suggestions": analysis.get("suggestions", {}).get("suggestions", []),
                 "timestamp": datetime.now().isoformat()
             })
     
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         try:
@@ -470,9 +560,37 @@ async def websocket_realtime_audit(websocket: WebSocket):
         except:
             pass
     finally:
+        # Finalize the session so dropped connections don't leak it
+        if conversation_id in engine.active_conversations:
+            result = audit_service.end_realtime_audit(conversation_id, agent_id)
+            report = result.get("final_report") or {}
+            logger.info(f"WebSocket session {conversation_id} finalized: "
+                        f"{report.get('segments_analyzed', 0)} segments, {report.get('compliance_status', 'n/a')}")
         logger.info(f"WebSocket disconnected: {conversation_id}")
 
 
+@app.get("/audit/realtime/{conversation_id}/report", tags=["RealTime Audit"])
+async def realtime_audit_report(conversation_id: str):
+    """
+    Report so far for an active real-time audit session.
+    
+    Returns: Running score averages, min/max/variance per metric, violations
+    and sentiment summary, without ending the session
+    """
+    if audit_service is None:
+        raise HTTPException(status_code=503, detail="Service not initialized")
+    
+    result = audit_service.get_realtime_report(conversation_id)
+    if result.get("status") != "success":
+        raise HTTPException(status_code=404, detail=result.get("message", "Conversation not found"))
+    return {
+        "success": True,
+        "conversation_id": conversation_id,
+        "report": result["report"],
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @app.post("/audit/realtime/end", tags=["RealTime Audit"])
 async def end_realtime_audit(request: Dict[str, str]):
     """
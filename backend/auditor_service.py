@@ -90,6 +90,24 @@ class EnterpriseQualityAuditorService:
             conversation_id, agent_message, customer_message, agent_id
         )
     
+    async def process_realtime_segment_async(self,
+                                             conversation_id: str,
+                                             agent_message: str,
+                                             customer_message: str,
+                                             agent_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async version of process_realtime_segment for use inside FastAPI handlers.
+        LLM scoring is awaited instead of blocking the event loop.
+        """
+        self.total_segments += 1
+        return await self.streaming_engine.add_segment_async(
+            conversation_id, agent_message, customer_message, agent_id
+        )
+    
+    def get_realtime_report(self, conversation_id: str) -> Dict[str, Any]:
+        """Report so far for an active real-time audit (running aggregates, no timeline)"""
+        return self.streaming_engine.get_conversation_report(conversation_id)
+    
     def end_realtime_audit(self, conversation_id: str, agent_id: Optional[str] = None) -> Dict[str, Any]:
         """
         End real-time audit and generate final report.
@@ -210,11 +228,8 @@ class EnterpriseQualityAuditorService:
         Perform full audit on complete transcript.
         Returns comprehensive analysis similar to batch processing.
         """
-        # Quality scoring
-        if self.llm_manager and self.streaming_engine.enable_llm:
-            quality = self.llm_manager.analyze_text(transcript_text, "quality")
-        else:
-            quality = self.streaming_engine._heuristic_quality_score(transcript_text)
+        # Quality scoring (LLM with heuristic fallback when unavailable)
+        quality = self.streaming_engine._score_quality(transcript_text)
         
         # Sentiment analysis
         sentiment_analysis = self.sentiment_analyzer.comprehensive_analysis(transcript_text)
@@ -261,6 +276,18 @@ class EnterpriseQualityAuditorService:
             "message": f"Policy '{title}' added successfully"
         }
     
+    def add_compliance_policies(self, policies: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Bulk-import a compliance policy pack.
+        Each policy dict needs title, content, category and severity.
+        """
+        policy_ids = self.rag_system.add_custom_policies(policies)
+        return {
+            "status": "success",
+            "policy_ids": policy_ids,
+            "message": f"{len(policy_ids)} policies imported successfully"
+        }
+    
     def get_policy_summary(self) -> Dict[str, Any]:
         """Get summary of all loaded policies"""
         return self.rag_system.get_policy_summary()
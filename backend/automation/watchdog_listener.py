@@ -1,13 +1,15 @@
 import os
 import time
 import json
+import asyncio
 import logging
 import shutil
+import threading
 from pathlib import Path
 from datetime import datetime
 from watchdog.events import FileSystemEventHandler
 
-from backend.core.multilingual_transcribe import get_transcription_engine
+from backend.core.transcription_pool import get_transcription_pool, TranscriptionQueueFullError
 from backend.core.pii_masking import get_masking_pipeline
 from backend.auditor_service import EnterpriseQualityAuditorService
 
@@ -15,6 +17,9 @@ logger = logging.getLogger(__name__)
 
 SUPPORTED_FORMATS = {'.mp3', '.wav', '.ogg', '.flac'}
 
+# Seconds to wait before resubmitting a file when the transcription queue is full
+QUEUE_FULL_RETRY_DELAY = 5.0
+
 class AudioFileHandler(FileSystemEventHandler):
     def __init__(self, incoming_dir: str, processed_dir: str, db_file: str):
         self.incoming_dir = Path(incoming_dir)
@@ -22,9 +27,19 @@ class AudioFileHandler(FileSystemEventHandler):
         self.db_file = Path(db_file)
         
         # Initialize services
-        self.transcription_engine = get_transcription_engine()
+        self.transcription_pool = get_transcription_pool()
+        self.transcription_pool.start()
         self.masking_pipeline = get_masking_pipeline()
         self.auditor_service = EnterpriseQualityAuditorService()
+        self._db_lock = threading.Lock()
+        
+        # Files are processed concurrently on a background event loop so the
+        # transcription pool's workers are all kept busy
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="audio-file-handler", daemon=True
+        )
+        self._loop_thread.start()
         
     def on_created(self, event):
         if event.is_directory:
@@ -35,21 +50,38 @@ class AudioFileHandler(FileSystemEventHandler):
             return
             
         logger.info(f"New audio file detected: {file_path.name}")
-        
+        asyncio.run_coroutine_threadsafe(self._handle_file(file_path), self._loop)
+    
+    async def _handle_file(self, file_path: Path):
         # Wait a moment to ensure file is fully written
-        time.sleep(2)
+        await asyncio.sleep(2)
         
         try:
-            self.process_file(file_path)
+            await self.process_file_async(file_path)
         except Exception as e:
             logger.error(f"Error processing file {file_path.name}: {e}")
-
+    
     def process_file(self, file_path: Path):
+        """Blocking wrapper around process_file_async"""
+        return asyncio.run_coroutine_threadsafe(self.process_file_async(file_path), self._loop).result()
+    
+    async def process_file_async(self, file_path: Path):
         filename = file_path.name
         
         logger.info(f"[{filename}] Step 1 - Transcribing audio...")
-        transcription_result = self.transcription_engine.transcribe_and_process(str(file_path))
-        transcript = transcription_result.transcript
+        while True:
+            try:
+                transcription_result = await self.transcription_pool.transcribe(str(file_path))
+                break
+            except TranscriptionQueueFullError:
+                logger.info(f"[{filename}] Transcription queue full, retrying in {QUEUE_FULL_RETRY_DELAY:.0f}s")
+                await asyncio.sleep(QUEUE_FULL_RETRY_DELAY)
+        
+        # Masking, auditing and saving are blocking; keep them off the event loop
+        await asyncio.to_thread(self._finish_file, file_path, transcription_result.transcript)
+    
+    def _finish_file(self, file_path: Path, transcript: str):
+        filename = file_path.name
         
         logger.info(f"[{filename}] Step 2 - Applying PII masking...")
         masking_result = self.masking_pipeline.process_transcript(filename, transcript)
@@ -93,7 +125,18 @@ class AudioFileHandler(FileSystemEventHandler):
         shutil.move(str(file_path), str(self.processed_dir / filename))
         logger.info(f"[{filename}] Processing complete.")
         
+    def close(self):
+        """Stop the processing loop and transcription workers"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5)
+        self.transcription_pool.shutdown()
+        
     def save_to_db(self, record):
+        # Files finish concurrently; serialize the read-modify-write of the JSON DB
+        with self._db_lock:
+            self._save_to_db(record)
+    
+    def _save_to_db(self, record):
         records = []
         if self.db_file.exists():
             try:
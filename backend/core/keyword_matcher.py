@@ -0,0 +1,170 @@
+"""
+Shared Keyword Matching Engine
+Single-pass multi-pattern matcher (Aho-Corasick) for all keyword-based analyzers.
+Architecture Decision: Compile every analyzer's keyword table into one automaton to:
+  1. Scan each transcript once, linear in text length
+  2. Keep cost independent of the total number of keywords
+  3. Share one scan between the quality, sentiment, emotion, escalation
+     and agent-assist analyzers looking at the same text
+  4. Preserve the original case-insensitive substring semantics ("kw in text")
+"""
+
+import logging
+import threading
+from typing import Dict, List, Iterable, Tuple, Optional
+from collections import OrderedDict, deque
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordHits:
+    """Result of scanning one text: which keywords occur, grouped by table/category"""
+    
+    __slots__ = ("matched", "_by_category")
+    
+    def __init__(self, matched: frozenset, by_category: Dict[Tuple[str, str], List[str]]):
+        self.matched = matched
+        self._by_category = by_category
+    
+    def has(self, keyword: str) -> bool:
+        """True if the keyword occurs anywhere in the text"""
+        return keyword.lower() in self.matched
+    
+    def found(self, table: str, category: str) -> List[str]:
+        """Distinct keywords of a category present in the text"""
+        return self._by_category.get((table, category), [])
+    
+    def count(self, table: str, category: str) -> int:
+        """Number of distinct keywords of a category present in the text"""
+        return len(self._by_category.get((table, category), ()))
+    
+    def any(self, table: str, category: str) -> bool:
+        return (table, category) in self._by_category
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over every registered keyword table.
+    Tables are registered as {category: [keywords]}; the automaton is rebuilt
+    lazily only when a table actually changes. Recent scans are cached by
+    exact text so several analyzers reading the same transcript share one pass.
+    """
+    
+    def __init__(self, cache_size: int = 256):
+        self._tables: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        self._automaton: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, KeywordHits]" = OrderedDict()
+        self._cache_size = cache_size
+        self._generation = 0
+    
+    def register(self, table: str, categories: Dict[str, Iterable[str]]) -> None:
+        """Add or replace a keyword table"""
+        normalized = {str(cat): tuple(kw.lower() for kw in kws) for cat, kws in categories.items()}
+        with self._lock:
+            if self._tables.get(table) == normalized:
+                return
+            self._tables[table] = normalized
+            self._automaton = None
+            self._generation += 1
+            self._cache.clear()
+    
+    def _build(self) -> tuple:
+        """Compile all tables into goto/fail/output arrays"""
+        memberships: Dict[str, List[Tuple[str, str]]] = {}
+        for table, categories in self._tables.items():
+            for category, keywords in categories.items():
+                for keyword in dict.fromkeys(keywords):
+                    if keyword:
+                        memberships.setdefault(keyword, []).append((table, category))
+        
+        patterns = list(memberships)
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                nxt = goto[node].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][char] = nxt
+                    goto.append({})
+                    output.append([])
+                node = nxt
+            output[node].append(pattern_id)
+        
+        # Depth-1 states fail to the root; deeper ones follow their parent's fail chain
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                output[child].extend(output[fail[child]])
+        
+        logger.debug(f"Keyword automaton built: {len(patterns)} patterns, {len(goto)} states")
+        return goto, fail, output, patterns, [memberships[p] for p in patterns]
+    
+    def _get_automaton(self) -> tuple:
+        automaton = self._automaton
+        if automaton is None:
+            with self._lock:
+                if self._automaton is None:
+                    self._automaton = self._build()
+                automaton = self._automaton
+        return automaton
+    
+    def scan(self, text: str, use_cache: bool = True) -> KeywordHits:
+        """
+        Find every registered keyword occurring in text (case-insensitive) in one pass.
+        Pass use_cache=False for fragments scanned once (e.g. single sentences)
+        so they do not evict whole-transcript results.
+        """
+        with self._lock:
+            cached = self._cache.get(text) if use_cache else None
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return cached
+            generation = self._generation
+        
+        goto, fail, output, patterns, memberships = self._get_automaton()
+        seen = set()
+        by_category: Dict[Tuple[str, str], List[str]] = {}
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern_id in output[node]:
+                if pattern_id not in seen:
+                    seen.add(pattern_id)
+                    keyword = patterns[pattern_id]
+                    for key in memberships[pattern_id]:
+                        by_category.setdefault(key, []).append(keyword)
+        
+        hits = KeywordHits(frozenset(patterns[i] for i in seen), by_category)
+        if not use_cache:
+            return hits
+        with self._lock:
+            if generation != self._generation:
+                return hits
+            self._cache[text] = hits
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return hits
+
+
+# Singleton shared by all analyzers
+_keyword_matcher: Optional[KeywordMatcher] = None
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Get or create the global keyword matcher"""
+    global _keyword_matcher
+    if _keyword_matcher is None:
+        _keyword_matcher = KeywordMatcher()
+    return _keyword_matcher
@@ -11,11 +11,27 @@ Architecture Decision: Separate LLM calls into a provider class to:
 
 import os
 import json
+import time
+import asyncio
+import sqlite3
+import random
+import hashlib
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Optional, Dict, Any, List, Callable
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import Future
 from dotenv import load_dotenv
-from groq import Groq
+import httpx
+from groq import Groq, AsyncGroq
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -33,24 +49,34 @@ class BaseLLMProvider(ABC):
     def query_with_context(self, prompt: str, context: str, response_format: Optional[str] = None) -> str:
         """Send query with additional context"""
         pass
+    
+    async def aquery(self, prompt: str, response_format: Optional[str] = None) -> str:
+        """Async query; default runs the blocking call in a worker thread"""
+        return await asyncio.to_thread(self.query, prompt, response_format)
+    
+    async def aquery_with_context(self, prompt: str, context: str, response_format: Optional[str] = None) -> str:
+        """Async query with additional context"""
+        return await self.aquery(f"{context}\n\n{prompt}", response_format)
 
 
 class GroqProvider(BaseLLMProvider):
     """Groq LLM Provider - Production ready with error handling"""
     
-    def __init__(self, model: str = "llama-3.3-70b-versatile"):
+    def __init__(self, model: str = "llama-3.3-70b-versatile", max_retries: int = 3):
         """
         Initialize Groq client
         Args:
             model: Model name (default: Llama 3.3 70B for best accuracy)
+            max_retries: Attempts per query (use 1 when wrapped by ResilientLLMProvider)
         """
         self.api_key = os.getenv("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError("GROQ_API_KEY not found in environment variables")
         
-        self.client = Groq(api_key=self.api_key)
+        # SDK-level retries are disabled; retry policy lives in this layer
+        self.client = Groq(api_key=self.api_key, max_retries=0)
         self.model = model
-        self.max_retries = 3
+        self.max_retries = max_retries
     
     def query(self, prompt: str, response_format: Optional[str] = None) -> str:
         """Execute LLM query with retry logic"""
@@ -61,24 +87,28 @@ class GroqProvider(BaseLLMProvider):
         full_prompt = f"{context}\n\n{prompt}"
         return self._execute_query(full_prompt, response_format)
     
+    def _build_request(self, prompt: str, response_format: Optional[str] = None) -> Dict[str, Any]:
+        """Build chat completion kwargs"""
+        kwargs = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        
+        if response_format == "json":
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+    
     def _execute_query(self, prompt: str, response_format: Optional[str] = None) -> str:
         """Internal execution with retry mechanism"""
         for attempt in range(self.max_retries):
             try:
-                kwargs = {
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": prompt}],
-                }
-                
-                if response_format == "json":
-                    kwargs["response_format"] = {"type": "json_object"}
-                
+                kwargs = self._build_request(prompt, response_format)
                 response = self.client.chat.completions.create(**kwargs)
                 content = response.choices[0].message.content
                 
                 logger.debug(f"LLM query successful on attempt {attempt + 1}")
                 return content
-                
+            
             except Exception as e:
                 logger.warning(f"LLM query failed (attempt {attempt + 1}/{self.max_retries}): {str(e)}")
                 if attempt == self.max_retries - 1:
@@ -87,28 +117,719 @@ class GroqProvider(BaseLLMProvider):
         return ""
 
 
+class AsyncGroqProvider(GroqProvider):
+    """
+    Groq provider with a native async path.
+    All async calls share one pooled httpx client and are capped by a
+    concurrency semaphore, so slow LLM calls never block the event loop.
+    Sync query() keeps working through the inherited blocking client.
+    """
+    
+    def __init__(self, model: str = "llama-3.3-70b-versatile",
+                 max_concurrency: Optional[int] = None,
+                 max_connections: Optional[int] = None,
+                 timeout_seconds: float = 60.0,
+                 max_retries: int = 3):
+        """
+        Args:
+            model: Model name
+            max_concurrency: Max in-flight async requests (LLM_MAX_CONCURRENCY, default 16)
+            max_connections: HTTP connection pool size (defaults to max_concurrency)
+            timeout_seconds: Per-request timeout
+            max_retries: Attempts per query (use 1 when wrapped by ResilientLLMProvider)
+        """
+        super().__init__(model=model, max_retries=max_retries)
+        self.max_concurrency = max_concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+        self.max_connections = max_connections or self.max_concurrency
+        self.timeout_seconds = timeout_seconds
+        self._async_client: Optional[AsyncGroq] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    def _get_async_client(self) -> AsyncGroq:
+        """Lazily create the shared pooled client inside the running loop"""
+        if self._async_client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                timeout=self.timeout_seconds
+            )
+            self._async_client = AsyncGroq(api_key=self.api_key, http_client=self._http_client,
+                                           max_retries=0)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._async_client
+    
+    async def aquery(self, prompt: str, response_format: Optional[str] = None) -> str:
+        """Execute async LLM query with retry logic"""
+        client = self._get_async_client()
+        for attempt in range(self.max_retries):
+            try:
+                async with self._semaphore:
+                    response = await client.chat.completions.create(
+                        **self._build_request(prompt, response_format)
+                    )
+                logger.debug(f"Async LLM query successful on attempt {attempt + 1}")
+                return response.choices[0].message.content
+            
+            except Exception as e:
+                logger.warning(f"Async LLM query failed (attempt {attempt + 1}/{self.max_retries}): {str(e)}")
+                if attempt == self.max_retries - 1:
+                    raise RuntimeError(f"LLM query failed after {self.max_retries} attempts") from e
+        
+        return ""
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        self._async_client = None
+        self._http_client = None
+        self._semaphore = None
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the provider while the circuit breaker is open"""
+    pass
+
+
+class RateLimitedError(RuntimeError):
+    """Raised when the client-side rate limiter cannot grant a slot in time"""
+    pass
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter, honouring server retry-after hints"""
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before the next attempt (attempt is 0-based)"""
+        if retry_after is not None:
+            return min(self.max_delay, max(0.0, retry_after))
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class TokenBucket:
+    """Client-side token-bucket rate limiter (thread-safe, usable from async code)"""
+    
+    def __init__(self, rate_per_second: float, capacity: float, max_wait: float = 5.0):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take one token, returning how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if wait > self.max_wait:
+                raise RateLimitedError(f"LLM rate limit exceeded (would wait {wait:.1f}s)")
+            self._tokens -= 1
+            return wait
+    
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def aacquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Classic closed -> open -> half-open breaker.
+    Opens after failure_threshold consecutive failures; after recovery_timeout
+    a single trial call is let through to probe the provider. A trial that
+    never reports back (e.g. a cancelled caller) is abandoned after trial_timeout.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 trial_timeout: Optional[float] = None):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.trial_timeout = trial_timeout if trial_timeout is not None else max(recovery_timeout, 60.0)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.rejected_calls = 0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+    
+    def _refresh(self, now: float) -> None:
+        """Open -> half-open after recovery_timeout; drop a stale trial (lock held)"""
+        if self.state == self.OPEN and now - self.opened_at >= self.recovery_timeout:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN and self._trial_in_flight \
+                and now - self._trial_started >= self.trial_timeout:
+            logger.warning("LLM circuit breaker trial call never completed; allowing a new trial")
+            self._trial_in_flight = False
+    
+    def would_reject(self) -> bool:
+        """Pre-check that claims nothing: True if a call right now would be rejected"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return False
+            self._refresh(time.monotonic())
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                return False
+            self.rejected_calls += 1
+            return True
+    
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            self._refresh(now)
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                self._trial_started = now
+                return True
+            self.rejected_calls += 1
+            return False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+    
+    def release_trial(self) -> None:
+        """Give back a half-open trial slot for a call that ended without an outcome"""
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"LLM circuit breaker opened after {self.consecutive_failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "rejected_calls": self.rejected_calls
+        }
+
+
+class ResilientLLMProvider(BaseLLMProvider):
+    """
+    Resilience layer around any BaseLLMProvider: token-bucket rate limiting,
+    exponential backoff with jitter (respecting retry-after), and a circuit
+    breaker that fails fast with CircuitOpenError while the provider is unhealthy.
+    """
+    
+    NON_RETRYABLE_STATUS = {400, 401, 403, 404, 422}
+    
+    def __init__(self,
+                 provider: BaseLLMProvider,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+        self.provider = provider
+        self.model = getattr(provider, "model", type(provider).__name__)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+    
+    @staticmethod
+    def _provider_error(exc: BaseException) -> BaseException:
+        """Unwrap RuntimeError(...) from e chains to reach the SDK/HTTP error"""
+        while exc.__cause__ is not None and not hasattr(exc, "status_code"):
+            exc = exc.__cause__
+        return exc
+    
+    @classmethod
+    def _status_code(cls, exc: BaseException) -> Optional[int]:
+        error = cls._provider_error(exc)
+        status = getattr(error, "status_code", None)
+        if status is None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        return status
+    
+    @classmethod
+    def _retry_after(cls, exc: BaseException) -> Optional[float]:
+        """Seconds from a Retry-After header on the underlying HTTP response, if any"""
+        headers = getattr(getattr(cls._provider_error(exc), "response", None), "headers", None)
+        if not headers:
+            return None
+        value = headers.get("retry-after")
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+    
+    def _check_open(self) -> None:
+        """Fail fast while the circuit is open, before spending a rate-limit token"""
+        if self.circuit_breaker.would_reject():
+            raise CircuitOpenError("LLM provider circuit is open")
+    
+    def _before_attempt(self) -> None:
+        """Claim the call (the half-open trial slot, if any) once a token is held"""
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError("LLM provider circuit is open")
+    
+    def _after_failure(self, exc: Exception, attempt: int) -> Optional[float]:
+        """Record a failure; return the backoff delay, or None to stop retrying"""
+        status = self._status_code(exc)
+        logger.warning(f"LLM query failed (attempt {attempt + 1}/{self.retry_policy.max_attempts}, "
+                       f"status={status}): {exc}")
+        if status in self.NON_RETRYABLE_STATUS:
+            # The provider answered; a bad request says nothing about its health
+            self.circuit_breaker.release_trial()
+            return None
+        self.circuit_breaker.record_failure()
+        if attempt == self.retry_policy.max_attempts - 1:
+            return None
+        if self.circuit_breaker.state == CircuitBreaker.OPEN:
+            return None
+        return self.retry_policy.compute_delay(attempt, self._retry_after(exc))
+    
+    def query(self, prompt: str, response_format: Optional[str] = None) -> str:
+        """Execute query with rate limiting, backoff and circuit breaking"""
+        for attempt in range(self.retry_policy.max_attempts):
+            self._check_open()
+            # Take the token before claiming the call so a RateLimitedError can't strand a half-open trial
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            self._before_attempt()
+            try:
+                result = self.provider.query(prompt, response_format)
+                self.circuit_breaker.record_success()
+                return result
+            except Exception as e:
+                delay = self._after_failure(e, attempt)
+                if delay is None:
+                    raise RuntimeError(f"LLM query failed after {attempt + 1} attempts") from e
+            except BaseException:
+                self.circuit_breaker.release_trial()
+                raise
+            time.sleep(delay)
+        return ""
+    
+    def query_with_context(self, prompt: str, context: str, response_format: Optional[str] = None) -> str:
+        return self.query(f"{context}\n\n{prompt}", response_format)
+    
+    async def aquery(self, prompt: str, response_format: Optional[str] = None) -> str:
+        """Async variant of query"""
+        for attempt in range(self.retry_policy.max_attempts):
+            self._check_open()
+            if self.rate_limiter:
+                await self.rate_limiter.aacquire()
+            self._before_attempt()
+            try:
+                result = await self.provider.aquery(prompt, response_format)
+                self.circuit_breaker.record_success()
+                return result
+            except Exception as e:
+                delay = self._after_failure(e, attempt)
+                if delay is None:
+                    raise RuntimeError(f"LLM query failed after {attempt + 1} attempts") from e
+            except BaseException:
+                # Cancelled mid-call: no verdict on the provider, free the trial slot
+                self.circuit_breaker.release_trial()
+                raise
+            await asyncio.sleep(delay)
+        return ""
+    
+    async def aclose(self) -> None:
+        close = getattr(self.provider, "aclose", None)
+        if close:
+            await close()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"circuit_breaker": self.circuit_breaker.stats()}
+
+
+def create_resilient_provider(provider: Optional[BaseLLMProvider] = None) -> ResilientLLMProvider:
+    """Wrap a provider (default: AsyncGroqProvider) with settings from the environment"""
+    provider = provider or AsyncGroqProvider(max_retries=1)
+    rpm = float(os.getenv("LLM_RATE_LIMIT_RPM", "300"))
+    return ResilientLLMProvider(
+        provider,
+        retry_policy=RetryPolicy(max_attempts=int(os.getenv("LLM_MAX_RETRIES", "3"))),
+        rate_limiter=TokenBucket(rpm / 60.0, float(os.getenv("LLM_RATE_LIMIT_BURST", "10"))) if rpm > 0 else None,
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5")),
+            recovery_timeout=float(os.getenv("LLM_CIRCUIT_RECOVERY_SECONDS", "30"))
+        )
+    )
+
+
+class BaseCacheBackend(ABC):
+    """Interface for LLM response cache storage"""
+    
+    name = "base"
+    blocking = True  # Does I/O; async callers offload it to a thread
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return cached value or None if missing/expired"""
+        pass
+    
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store value, applying the backend's size and TTL limits"""
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+    
+    def size(self) -> Optional[int]:
+        """Number of stored entries, if cheaply known"""
+        return None
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """In-process LRU cache with per-entry TTL"""
+    
+    name = "memory"
+    blocking = False
+    
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 86400.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._data[key] = (time.time() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+    
+    def size(self) -> Optional[int]:
+        return len(self._data)
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """File-backed cache that survives restarts and is shared by local workers"""
+    
+    name = "sqlite"
+    
+    def __init__(self, path: str, max_entries: int = 100000, ttl_seconds: float = 86400.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)")
+        self._conn.commit()
+    
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return row[0]
+    
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now)
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,))
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+            self._conn.commit()
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+    
+    def size(self) -> Optional[int]:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """
+    Redis-backed cache shared by all API workers.
+    TTL is enforced per key; total size is bounded by the server's
+    maxmemory/LRU policy.
+    """
+    
+    name = "redis"
+    
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, ttl_seconds: float = 86400.0,
+                 prefix: str = "llm_cache:"):
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis not installed. Install with: pip install redis")
+        
+        self.client = redis.Redis(host=host, port=port, db=db, password=password or None,
+                                  decode_responses=True, socket_timeout=2.0)
+        self.client.ping()
+        self.ttl_seconds = int(ttl_seconds)
+        self.prefix = prefix
+    
+    def get(self, key: str) -> Optional[str]:
+        return self.client.get(self.prefix + key)
+    
+    def set(self, key: str, value: str) -> None:
+        self.client.set(self.prefix + key, value, ex=self.ttl_seconds)
+    
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=f"{self.prefix}*", count=500):
+            self.client.delete(key)
+
+
+class _LeaderCancelled(Exception):
+    """Set on a coalesced future when the caller computing it is cancelled"""
+
+
 class LLMCache:
-    """Simple in-memory cache for LLM responses (can be upgraded to Redis)"""
+    """
+    LLM response cache over a pluggable backend.
+    Keys are stable digests (never Python's salted hash()), concurrent misses
+    for the same key are coalesced into one provider call, and hit-ratio
+    metrics are tracked per process.
+    """
     
-    def __init__(self):
-        self.cache: Dict[str, str] = {}
+    def __init__(self, backend: Optional[BaseCacheBackend] = None):
+        self.backend = backend or MemoryCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.backend_errors = 0
+        self._inflight: Dict[str, Future] = {}
+        self._async_inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(model: str, analysis_type: str, prompt: str) -> str:
+        """Stable digest of model, analysis type and the full prompt (which embeds the text)"""
+        digest = hashlib.sha256()
+        for part in (model, analysis_type, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return f"{analysis_type}:{digest.hexdigest()}"
     
     def get(self, key: str) -> Optional[str]:
-        return self.cache.get(key)
+        try:
+            return self.backend.get(key)
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning(f"LLM cache read failed ({self.backend.name}): {e}")
+            return None
     
     def set(self, key: str, value: str) -> None:
-        self.cache[key] = value
+        try:
+            self.backend.set(key, value)
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning(f"LLM cache write failed ({self.backend.name}): {e}")
+    
+    def get_or_compute(self, key: str, compute: Callable[[], str],
+                       cacheable: Callable[[str], bool] = lambda value: True) -> str:
+        """
+        Return the cached value or compute it once.
+        Concurrent callers missing on the same key wait for the first caller's result.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not leader:
+            self.coalesced += 1
+            return future.result()
+        
+        self.misses += 1
+        try:
+            value = compute()
+            if cacheable(value):
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+    
+    async def aget_or_compute(self, key: str, compute: Callable[[], Any],
+                              cacheable: Callable[[str], bool] = lambda value: True) -> str:
+        """Async variant of get_or_compute; compute must return an awaitable"""
+        if self.backend.blocking:
+            cached = await asyncio.to_thread(self.get, key)
+        else:
+            cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        
+        future = self._async_inflight.get(key)
+        while future is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # The computing caller went away; the next follower in line takes over
+                future = self._async_inflight.get(key)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._async_inflight[key] = future
+        self.misses += 1
+        try:
+            value = await compute()
+            if cacheable(value):
+                if self.backend.blocking:
+                    await asyncio.to_thread(self.set, key, value)
+                else:
+                    self.set(key, value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # Never cancel the shared future: followers would see their own call cancelled
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody awaited is not logged
+            future.exception()
+            raise
+        finally:
+            self._async_inflight.pop(key, None)
     
     def clear(self) -> None:
-        self.cache.clear()
+        self.backend.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        try:
+            size = self.backend.size()
+        except Exception:
+            size = None
+        return {
+            "backend": self.backend.name,
+            "entries": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "backend_errors": self.backend_errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+
+
+def create_cache_backend(backend: Optional[str] = None) -> BaseCacheBackend:
+    """
+    Build the cache backend selected by LLM_CACHE_BACKEND (memory, sqlite, redis).
+    Falls back to the in-process backend if Redis is unreachable.
+    """
+    backend = (backend or os.getenv("LLM_CACHE_BACKEND", "memory")).lower()
+    max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+    ttl_seconds = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+    
+    if backend == "sqlite":
+        path = os.getenv("LLM_CACHE_SQLITE_PATH", "./data/llm_cache.sqlite3")
+        return SQLiteCacheBackend(path, max_entries=max_entries, ttl_seconds=ttl_seconds)
+    
+    if backend == "redis":
+        try:
+            return RedisCacheBackend(
+                host=os.getenv("REDIS_HOST", "localhost"),
+                port=int(os.getenv("REDIS_PORT", "6379")),
+                db=int(os.getenv("REDIS_DB", "0")),
+                password=os.getenv("REDIS_PASSWORD"),
+                ttl_seconds=ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Redis cache unavailable, falling back to in-memory cache: {e}")
+    
+    return MemoryCacheBackend(max_entries=max_entries, ttl_seconds=ttl_seconds)
 
 
 class LLMManager:
     """Manager for LLM interactions with caching and logging"""
     
-    def __init__(self, provider: Optional[BaseLLMProvider] = None, use_cache: bool = True):
-        self.provider = provider or GroqProvider()
-        self.cache = LLMCache() if use_cache else None
+    # Numeric fields a batched result must carry before it is trusted and cached
+    REQUIRED_SCORES = {
+        "quality": ("empathy", "professionalism", "resolution", "compliance", "escalation_risk"),
+        "sentiment": ("sentiment_score", "escalation_risk", "emotional_intensity"),
+        "compliance": ("severity_score",)
+    }
+    
+    def __init__(self, provider: Optional[BaseLLMProvider] = None, use_cache: bool = True,
+                 cache: Optional[LLMCache] = None):
+        self.provider = provider or create_resilient_provider()
+        self.cache = (cache or LLMCache(create_cache_backend())) if use_cache else None
     
     def analyze_text(self, text: str, analysis_type: str) -> Dict[str, Any]:
         """
@@ -120,24 +841,168 @@ class LLMManager:
         
         Returns: JSON response from LLM
         """
-        cache_key = f"{analysis_type}:{hash(text) % 100000}" if self.cache else None
+        prompt = self._get_analysis_prompt(text, analysis_type)
         
-        if self.cache and cache_key in self.cache.cache:
-            logger.debug(f"Cache hit for {analysis_type}")
-            return json.loads(self.cache.get(cache_key))
+        if self.cache:
+            cache_key = self._cache_key(analysis_type, prompt)
+            response = self.cache.get_or_compute(
+                cache_key,
+                lambda: self.provider.query(prompt, response_format="json"),
+                cacheable=self._is_valid_json
+            )
+        else:
+            response = self.provider.query(prompt, response_format="json")
         
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse JSON response: {response}")
+            return {"error": "Invalid JSON response", "raw": response}
+    
+    async def analyze_text_async(self, text: str, analysis_type: str) -> Dict[str, Any]:
+        """
+        Async version of analyze_text.
+        Awaits the provider's aquery so concurrent conversations do not block each other.
+        """
         prompt = self._get_analysis_prompt(text, analysis_type)
-        response = self.provider.query(prompt, response_format="json")
+        
+        if self.cache:
+            cache_key = self._cache_key(analysis_type, prompt)
+            response = await self.cache.aget_or_compute(
+                cache_key,
+                lambda: self.provider.aquery(prompt, response_format="json"),
+                cacheable=self._is_valid_json
+            )
+        else:
+            response = await self.provider.aquery(prompt, response_format="json")
         
         try:
-            result = json.loads(response)
-            if self.cache and cache_key:
-                self.cache.set(cache_key, response)
-            return result
+            return json.loads(response)
         except json.JSONDecodeError:
             logger.error(f"Failed to parse JSON response: {response}")
             return {"error": "Invalid JSON response", "raw": response}
     
+    async def analyze_batch_async(self, texts: List[str], analysis_type: str = "quality") -> List[Dict[str, Any]]:
+        """
+        Analyze several independent texts with one LLM round-trip.
+        Cached texts are served from the cache; the rest are packed into a
+        single JSON-array prompt and each result is cached under the same key
+        analyze_text would use. Items missing from the batch response, or
+        whose result fails validation, are retried individually, concurrently.
+        """
+        prompts = [self._get_analysis_prompt(t, analysis_type) for t in texts]
+        keys = [self._cache_key(analysis_type, p) for p in prompts]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        
+        pending: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            cached = None
+            if self.cache:
+                if self.cache.backend.blocking:
+                    cached = await asyncio.to_thread(self.cache.get, key)
+                else:
+                    cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.hits += 1
+                results[i] = json.loads(cached)
+            else:
+                pending.setdefault(key, []).append(i)
+        
+        if len(pending) == 1:
+            index = next(iter(pending.values()))[0]
+            result = await self.analyze_text_async(texts[index], analysis_type)
+            for i in pending[keys[index]]:
+                results[i] = result
+            return results
+        
+        if pending:
+            batch_keys = list(pending.keys())
+            items = [{"id": n, "conversation": texts[pending[k][0]]} for n, k in enumerate(batch_keys)]
+            response = await self.provider.aquery(
+                self._get_batch_analysis_prompt(items, analysis_type), response_format="json"
+            )
+            
+            by_id: Dict[int, Dict[str, Any]] = {}
+            try:
+                for entry in json.loads(response).get("results", []):
+                    n = entry.pop("id", None) if isinstance(entry, dict) else None
+                    if not isinstance(n, int) or isinstance(n, bool) or not 0 <= n < len(batch_keys) \
+                            or n in by_id or not self._is_valid_result(entry, analysis_type):
+                        logger.warning(f"Discarding invalid batched {analysis_type} result (id={n})")
+                        continue
+                    by_id[n] = entry
+            except (json.JSONDecodeError, AttributeError, TypeError):
+                logger.error(f"Failed to parse batched JSON response: {response}")
+            
+            missing = [key for n, key in enumerate(batch_keys) if n not in by_id]
+            fallbacks = await asyncio.gather(*[
+                self.analyze_text_async(texts[pending[key][0]], analysis_type) for key in missing
+            ])
+            retried = dict(zip(missing, fallbacks))
+            
+            for n, key in enumerate(batch_keys):
+                entry = by_id.get(n)
+                if entry is None:
+                    entry = retried[key]
+                elif self.cache:
+                    self.cache.misses += 1
+                    value = json.dumps(entry)
+                    if self.cache.backend.blocking:
+                        await asyncio.to_thread(self.cache.set, key, value)
+                    else:
+                        self.cache.set(key, value)
+                for i in pending[key]:
+                    results[i] = entry
+        
+        return results
+    
+    async def aclose(self) -> None:
+        """Release provider resources (pooled HTTP clients)"""
+        close = getattr(self.provider, "aclose", None)
+        if close:
+            await close()
+    
+    def _cache_key(self, analysis_type: str, prompt: str) -> str:
+        model = getattr(self.provider, "model", type(self.provider).__name__)
+        return LLMCache.make_key(model, analysis_type, prompt)
+    
+    @staticmethod
+    def _is_valid_json(response: str) -> bool:
+        try:
+            json.loads(response)
+            return True
+        except (TypeError, json.JSONDecodeError):
+            return False
+    
+    @classmethod
+    def _is_valid_result(cls, entry: Any, analysis_type: str) -> bool:
+        """A batched result has the single-call shape: a dict with numeric scores"""
+        if not isinstance(entry, dict) or "error" in entry:
+            return False
+        return all(
+            isinstance(entry.get(field), (int, float)) and not isinstance(entry.get(field), bool)
+            for field in cls.REQUIRED_SCORES.get(analysis_type, ())
+        )
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit ratio and size of the LLM response cache"""
+        return self.cache.stats() if self.cache else {"backend": "disabled"}
+    
+    def _get_batch_analysis_prompt(self, items: List[Dict[str, Any]], analysis_type: str) -> str:
+        """Build one prompt that scores several conversations independently"""
+        single = self._get_analysis_prompt("<conversation>", analysis_type)
+        schema = single.split("Return JSON ONLY:", 1)[-1].strip()
+        return f"""You will receive a JSON array of independent customer service conversations.
+Analyze each one separately; never let one conversation influence another's result.
+
+{json.dumps(items, ensure_ascii=False)}
+
+For every conversation produce an object with this shape plus its "id":
+{schema}
+
+Return JSON ONLY:
+{{"results": [{{"id": <id>, ...}}, ...]}}"""
+
     def _get_analysis_prompt(self, text: str, analysis_type: str) -> str:
         """Build prompt based on analysis type"""
         
@@ -157,7 +1022,7 @@ Return JSON ONLY:
   "strengths": ["List strong points"],
   "recommendations": ["Actionable improvements"]
 }}"""
-        
+
         elif analysis_type == "sentiment":
             return f"""Analyze sentiment and emotional tone:
 {text}
@@ -170,7 +1035,7 @@ Return JSON ONLY:
   "escalation_risk": 0-100,
   "emotional_intensity": 0-100
 }}"""
-        
+
         elif analysis_type == "compliance":
             return f"""Evaluate compliance issues in this transcript:
 {text}
@@ -183,5 +1048,93 @@ Return JSON ONLY:
   "required_actions": ["List actions needed"],
   "severity_score": 0-100
 }}"""
-        
+
         return ""
+
+
+class LLMBatchScheduler:
+    """
+    Micro-batching scheduler for LLM analysis requests.
+    Requests from many conversations that arrive within max_wait_ms of each
+    other (up to max_batch_size) are sent as one batched LLM call and the
+    results are routed back to each awaiting caller.
+    """
+    
+    def __init__(self, llm_manager: LLMManager, analysis_type: str = "quality",
+                 max_batch_size: Optional[int] = None, max_wait_ms: Optional[float] = None):
+        self.llm_manager = llm_manager
+        self.analysis_type = analysis_type
+        self.max_batch_size = max_batch_size or int(os.getenv("LLM_BATCH_MAX_SIZE", "8"))
+        self.max_wait = (max_wait_ms if max_wait_ms is not None
+                         else float(os.getenv("LLM_BATCH_MAX_WAIT_MS", "50"))) / 1000.0
+        self._pending: List[tuple] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # In-flight batch tasks, referenced so they aren't garbage-collected mid-call
+        self._tasks: set = set()
+        self.requests = 0
+        self.batches = 0
+    
+    async def submit(self, text: str) -> Dict[str, Any]:
+        """Queue text for the next batch and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        self.requests += 1
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: List[tuple]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            results = await self.llm_manager.analyze_batch_async(texts, self.analysis_type)
+        except asyncio.CancelledError:
+            # Fail the waiters rather than cancel them: their own calls weren't cancelled
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("LLM batch was cancelled"))
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """Send any queued requests, wait up to timeout for in-flight batches, then cancel the rest"""
+        self._flush()
+        if not self._tasks:
+            return
+        tasks = list(self._tasks)
+        _, unfinished = await asyncio.wait(tasks, timeout=timeout)
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0
+        }
@@ -11,16 +11,23 @@ Architecture Decision: Abstract transcription layer to:
 
 import logging
 import asyncio
-from typing import Dict, Optional, List, Any
+import re
+from typing import Dict, Optional, List, Any, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import os
 import subprocess
 
-# Maximum audio duration in seconds for processing
+# Maximum audio duration in seconds for processing in a single call
 MAX_AUDIO_DURATION = 900
 
+# Maximum audio duration in seconds for chunked (parallel) transcription
+MAX_CHUNKED_AUDIO_DURATION = 4 * 3600
+
+# Whisper decodes and resamples all audio to 16kHz mono
+WHISPER_SAMPLE_RATE = 16000
+
 try:
     import whisper
     WHISPER_AVAILABLE = True
@@ -59,6 +66,10 @@ class TranscriptionResult:
     is_translated: bool = False
     original_language: Optional[str] = None
     processing_time_ms: float = 0.0
+    # Position of this result within the source audio (chunked transcription)
+    start_offset_seconds: float = 0.0
+    # Whisper segments with absolute start/end seconds and text
+    segments: List[Dict[str, Any]] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -87,19 +98,132 @@ class BaseTranscriber:
         return await loop.run_in_executor(None, self.transcribe, audio_path)
 
 
-def get_audio_duration(audio_path: str) -> float:
+def probe_audio_duration(audio_path: str) -> Optional[float]:
     """
-    Get audio duration in seconds using Whisper's audio loading.
-    Fast — only reads metadata/header, does not transcribe.
+    Get audio duration in seconds from container/stream headers only.
+    Uses ffprobe (shipped with the ffmpeg Whisper already requires); WAV files
+    fall back to the stdlib wave module. Returns None if unknown.
     """
     try:
-        import whisper
-        audio = whisper.load_audio(audio_path)
-        duration = len(audio) / 16000  # Whisper resamples to 16kHz
-        return duration
-    except Exception as e:
-        logger.warning(f"Could not determine audio duration: {e}")
+        output = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=noprint_wrappers=1:nokey=1", audio_path],
+            capture_output=True, text=True, timeout=10, check=True
+        ).stdout.strip()
+        return float(output)
+    except (OSError, ValueError, subprocess.SubprocessError) as e:
+        logger.debug(f"ffprobe could not read duration of {audio_path}: {e}")
+    
+    if audio_path.lower().endswith(".wav"):
+        try:
+            import wave
+            with wave.open(audio_path, "rb") as wav:
+                return wav.getnframes() / float(wav.getframerate())
+        except Exception as e:
+            logger.debug(f"WAV header unreadable for {audio_path}: {e}")
+    return None
+
+
+def get_audio_duration(audio_path: str) -> float:
+    """
+    Get audio duration in seconds.
+    Fast — only reads metadata/header, does not decode.
+    """
+    duration = probe_audio_duration(audio_path)
+    if duration is None:
+        logger.warning(f"Could not determine audio duration: {audio_path}")
         return 0.0
+    return duration
+
+
+def load_audio_window(audio_path: str, start: float, duration: float):
+    """
+    Decode only [start, start + duration) seconds of a file to 16kHz mono
+    float32, the same format whisper.load_audio produces for the whole file.
+    """
+    import numpy as np
+    
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0",
+        "-ss", f"{start:.3f}", "-t", f"{duration:.3f}", "-i", audio_path,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(WHISPER_SAMPLE_RATE), "-"
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to decode audio window: {e.stderr.decode(errors='ignore')}") from e
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def plan_chunks(duration: float, chunk_seconds: float, overlap_seconds: float) -> List[Tuple[float, float]]:
+    """
+    Split [0, duration) into fixed windows of chunk_seconds that overlap their
+    predecessor by overlap_seconds. A short remainder is folded into the last window.
+    
+    Returns:
+        List of (start, length) in seconds
+    """
+    step = chunk_seconds - overlap_seconds
+    if step <= 0:
+        raise ValueError("chunk_seconds must be larger than overlap_seconds")
+    
+    chunks = []
+    start = 0.0
+    while start + chunk_seconds < duration:
+        chunks.append((start, chunk_seconds))
+        start += step
+    remainder = duration - start
+    if chunks and remainder < 2 * overlap_seconds:
+        previous_start, _ = chunks.pop()
+        chunks.append((previous_start, duration - previous_start))
+    else:
+        chunks.append((start, remainder))
+    return chunks
+
+
+def _normalize_words(text: str) -> List[str]:
+    return [re.sub(r"[^\w']", "", word.lower()) for word in text.split()]
+
+
+def merge_overlap_text(previous: str, text: str, max_words: int = 20) -> str:
+    """
+    Drop the start of text that repeats the end of previous (overlapping audio
+    transcribed twice). Compares up to max_words, ignoring case and punctuation.
+    """
+    prev_words = _normalize_words(previous)[-max_words:]
+    words = text.split()
+    next_words = _normalize_words(text)[:max_words]
+    for size in range(min(len(prev_words), len(next_words)), 0, -1):
+        if prev_words[-size:] == next_words[:size]:
+            return " ".join(words[size:])
+    return text
+
+
+def trim_to_window(result: TranscriptionResult, keep_from: float, keep_until: float,
+                   previous_text: str = "") -> TranscriptionResult:
+    """
+    Keep the part of a chunk's transcript that belongs to [keep_from, keep_until).
+    Segments are assigned by their midpoint so each overlapping segment is kept
+    by exactly one chunk; without segments, repeated words are trimmed instead.
+    """
+    if result.segments:
+        kept = [
+            segment for segment in result.segments
+            if keep_from <= (segment["start"] + segment["end"]) / 2 < keep_until
+        ]
+        result.segments = kept
+        result.transcript = " ".join(segment["text"].strip() for segment in kept)
+    elif previous_text:
+        result.transcript = merge_overlap_text(previous_text, result.transcript.strip())
+    return result
+
+
+def _check_duration(duration: float) -> None:
+    if duration > MAX_AUDIO_DURATION:
+        raise ValueError(
+            f"Audio exceeds recommended duration ({MAX_AUDIO_DURATION} seconds). "
+            f"Detected duration: {duration:.1f}s. Please upload shorter audio."
+        )
 
 
 class WhisperTranscriber(BaseTranscriber):
@@ -127,19 +251,22 @@ class WhisperTranscriber(BaseTranscriber):
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
-        # Validate audio duration before processing
-        duration = get_audio_duration(audio_path)
-        if duration > MAX_AUDIO_DURATION:
-            raise ValueError(
-                f"Audio exceeds recommended duration ({MAX_AUDIO_DURATION} seconds). "
-                f"Detected duration: {duration:.1f}s. Please upload shorter audio."
-            )
+        # Reject oversized files from the header alone, before any decode
+        probed = probe_audio_duration(audio_path)
+        if probed is not None:
+            _check_duration(probed)
+        
+        # Decode once (ffmpeg -> 16kHz float32) and hand the array to the model
+        audio = whisper.load_audio(audio_path)
+        duration = len(audio) / WHISPER_SAMPLE_RATE
+        if probed is None:
+            _check_duration(duration)
         
         logger.info(f"Starting transcription: {audio_path} (duration: {duration:.1f}s)")
         
         # Optimized Whisper settings for CPU performance
         result = self.model.transcribe(
-            audio_path,
+            audio,
             fp16=False,                       # Required for CPU (no CUDA)
             language="en",                     # Hint: skip language detection overhead
             condition_on_previous_text=False,  # Faster — don't condition on previous
@@ -151,7 +278,7 @@ class WhisperTranscriber(BaseTranscriber):
         # Map to SupportedLanguage enum
         lang_code = self._map_language_code(detected_language)
         
-        # Duration from validation
+        # Duration from the decoded samples
         processing_time = (time.time() - start_time) * 1000
         
         logger.info(f"Transcription completed in {processing_time:.0f}ms")
@@ -166,6 +293,38 @@ class WhisperTranscriber(BaseTranscriber):
             processing_time_ms=processing_time
         )
     
+    def transcribe_window(self, audio_path: str, start: float, duration: float) -> TranscriptionResult:
+        """
+        Transcribe one window of a long file (chunked transcription).
+        Only the window is decoded; segment times are absolute within the file.
+        """
+        import time
+        start_time = time.time()
+        
+        audio = load_audio_window(audio_path, start, duration)
+        result = self.model.transcribe(
+            audio,
+            fp16=False,
+            language="en",
+            condition_on_previous_text=False,
+        )
+        detected_language = result.get("language", "en")
+        segments = [
+            {"start": start + seg["start"], "end": start + seg["end"], "text": seg["text"]}
+            for seg in result.get("segments", [])
+        ]
+        
+        return TranscriptionResult(
+            transcript=result["text"].strip(),
+            detected_language=detected_language,
+            language_code=self._map_language_code(detected_language),
+            confidence=0.95,
+            duration_seconds=len(audio) / WHISPER_SAMPLE_RATE,
+            processing_time_ms=(time.time() - start_time) * 1000,
+            start_offset_seconds=start,
+            segments=segments
+        )
+    
     @staticmethod
     def _map_language_code(lang: str) -> SupportedLanguage:
         """Map language code to SupportedLanguage enum"""
@@ -230,7 +389,7 @@ class TranslationService:
         Args:
             text: Text to translate
             source_language: Source language code (e.g., 'es', 'hi')
-            
+        
         Returns:
             English translation or original text if translation fails
         """
@@ -248,6 +407,23 @@ class TranslationService:
         return text
 
 
+def translate_result(result: TranscriptionResult, translator: Optional[TranslationService]) -> TranscriptionResult:
+    """Translate a non-English transcription result to English in place"""
+    if result.language_code != SupportedLanguage.ENGLISH and translator:
+        logger.info(f"Translating from {result.detected_language} to English")
+        english_text = translator.translate_to_english(
+            result.transcript,
+            result.language_code.value
+        )
+        
+        # Update result
+        result.original_language = result.detected_language
+        result.transcript = english_text
+        result.is_translated = True
+        result.language_code = SupportedLanguage.ENGLISH
+    return result
+
+
 class MultilingualTranscriptionEngine:
     """
     End-to-end transcription with language detection and translation.
@@ -278,19 +454,8 @@ class MultilingualTranscriptionEngine:
         result = self.transcriber.transcribe(audio_path)
         
         # Step 2: Check if translation is needed
-        if self.auto_translate and result.language_code != SupportedLanguage.ENGLISH:
-            if self.translator:
-                logger.info(f"Translating from {result.detected_language} to English")
-                english_text = self.translator.translate_to_english(
-                    result.transcript,
-                    result.language_code.value
-                )
-                
-                # Update result
-                result.original_language = result.detected_language
-                result.transcript = english_text
-                result.is_translated = True
-                result.language_code = SupportedLanguage.ENGLISH
+        if self.auto_translate:
+            translate_result(result, self.translator)
         
         return result
     
@@ -9,8 +9,14 @@ Architecture Decision: Keep PII masking as a preprocessing layer to:
 4. Provide optional encryption for original transcripts
 """
 
+import os
 import re
+import time
+import bisect
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 from dataclasses import dataclass, field
@@ -93,21 +99,37 @@ class PiiMasker:
         ),
     }
     
-    def __init__(self, enable_ner: bool = True, spacy_model: str = "en_core_web_sm"):
+    # Overlapping matches are resolved in PATTERNS order (earlier wins)
+    PRIORITY = {pii_type: rank for rank, pii_type in enumerate(PATTERNS)}
+    
+    # All structured patterns as one alternation so the text is scanned once
+    COMBINED_PATTERN = re.compile(
+        "|".join(f"(?P<{pii_type.name}>{pattern.pattern})" for pii_type, pattern in PATTERNS.items())
+    )
+    
+    def __init__(self, enable_ner: bool = True, spacy_model: str = "en_core_web_sm",
+                 batch_size: Optional[int] = None, n_process: Optional[int] = None):
         """
         Initialize PII masker.
         
         Args:
             enable_ner: Whether to use spaCy for NER (name/location detection)
             spacy_model: spaCy model to use for NER
+            batch_size: Texts per nlp.pipe batch (env PII_NER_BATCH_SIZE)
+            n_process: Worker processes for large nlp.pipe batches (env PII_NER_PROCESSES)
         """
         self.enable_ner = enable_ner
         self.nlp = None
+        self.batch_size = batch_size or int(os.getenv("PII_NER_BATCH_SIZE", "64"))
+        self.n_process = n_process or int(os.getenv("PII_NER_PROCESSES", "1"))
+        # Pipeline components not needed for entity recognition
+        self.disabled_pipes: List[str] = []
         
         if enable_ner and SPACY_AVAILABLE:
             try:
                 self.nlp = spacy.load(spacy_model)
-                logger.info(f"spaCy model loaded: {spacy_model}")
+                self.disabled_pipes = self._non_ner_pipes(self.nlp)
+                logger.info(f"spaCy model loaded: {spacy_model} (NER only, disabled: {self.disabled_pipes})")
             except OSError:
                 logger.warning(f"spaCy model {spacy_model} not found. Install with: "
                               f"python -m spacy download {spacy_model}")
@@ -116,6 +138,15 @@ class PiiMasker:
             logger.warning("spaCy not installed. NER features disabled. "
                           "Install with: pip install spacy")
     
+    @staticmethod
+    def _non_ner_pipes(nlp) -> List[str]:
+        """Components to disable, keeping NER and any embedding layer it listens to"""
+        keep = {"ner"}
+        for name in ("tok2vec", "transformer"):
+            if name in nlp.pipe_names and "ner" in getattr(nlp.get_pipe(name), "listening_components", []):
+                keep.add(name)
+        return [name for name in nlp.pipe_names if name not in keep]
+    
     def mask(self, text: str, preserve_punctuation: bool = True) -> MaskingResult:
         """
         Mask PII in text using regex and NER.
@@ -127,64 +158,158 @@ class PiiMasker:
         Returns:
             MaskingResult with masked text and detected PII items
         """
-        import time
-        start_time = time.time()
+        return self.mask_many([text])[0]
+    
+    def mask_many(self, texts: List[str]) -> List[MaskingResult]:
+        """
+        Mask PII in several texts at once.
+        Regex runs per text; NER runs through nlp.pipe with only the NER
+        component enabled, using worker processes for large batches.
         
-        original_text = text
-        masked_text = text
-        detected_pii: List[PiiMatch] = []
+        Returns:
+            One MaskingResult per input text, in order
+        """
+        if not texts:
+            return []
         
-        # Step 1: Regex-based masking (structured data)
-        masked_text, regex_pii = self._mask_with_regex(masked_text)
-        detected_pii.extend(regex_pii)
+        regex_outputs = []
+        regex_times = []
+        for text in texts:
+            start_time = time.time()
+            regex_outputs.append(self._mask_with_regex(text))
+            regex_times.append(time.time() - start_time)
         
-        # Step 2: NER-based masking (names, locations)
+        # NER over the regex-masked texts; its cost is shared evenly across the batch
+        ner_outputs: List[Tuple[str, List[PiiMatch]]] = [(masked, []) for masked, _ in regex_outputs]
+        ner_time = 0.0
         if self.nlp:
-            masked_text, ner_pii = self._mask_with_ner(masked_text)
-            detected_pii.extend(ner_pii)
-        
-        processing_time = (time.time() - start_time) * 1000
+            start_time = time.time()
+            masked_texts = [masked for masked, _ in regex_outputs]
+            n_process = self.n_process if len(texts) >= self.n_process * self.batch_size else 1
+            docs = self.nlp.pipe(masked_texts, batch_size=self.batch_size,
+                                 n_process=n_process, disable=self.disabled_pipes)
+            ner_outputs = [self._mask_entities(masked, doc) for masked, doc in zip(masked_texts, docs)]
+            ner_time = (time.time() - start_time) / len(texts)
         
-        return MaskingResult(
-            masked_text=masked_text,
-            original_text=original_text,
-            detected_pii=detected_pii,
-            pii_count=len(detected_pii),
-            processing_time_ms=processing_time
-        )
+        results = []
+        for text, (_, regex_pii), (masked_text, ner_pii), regex_time in zip(
+                texts, regex_outputs, ner_outputs, regex_times):
+            self._restore_offsets(ner_pii, regex_pii)
+            detected_pii = regex_pii + ner_pii
+            results.append(MaskingResult(
+                masked_text=masked_text,
+                original_text=text,
+                detected_pii=detected_pii,
+                pii_count=len(detected_pii),
+                processing_time_ms=(regex_time + ner_time) * 1000
+            ))
+        return results
     
     def _mask_with_regex(self, text: str) -> Tuple[str, List[PiiMatch]]:
-        """Apply regex-based masking for structured data"""
+        """
+        Apply regex-based masking for structured data.
+        One scan with the combined pattern; offsets refer to the input text.
+        """
         detected = []
+        pos = 0
         
-        for pii_type, pattern in self.PATTERNS.items():
-            matches = list(pattern.finditer(text))
-            
-            # Process matches in reverse order to preserve positions
-            for match in reversed(matches):
-                pii = PiiMatch(
-                    type=pii_type,
-                    original_value=match.group(),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.95  # High confidence for regex matches
+        while True:
+            match = self.COMBINED_PATTERN.search(text, pos)
+            if match is None:
+                break
+            pii_type, start, end = self._resolve_priority(
+                text, PiiType[match.lastgroup], match.start(), match.end()
+            )
+            detected.append(PiiMatch(
+                type=pii_type,
+                original_value=text[start:end],
+                start_pos=start,
+                end_pos=end,
+                confidence=0.95  # High confidence for regex matches
+            ))
+            pos = end
+        
+        masked_text = self._replace_spans(text, detected)
+        
+        # Same ordering as per-pattern passes: by priority, last match first
+        detected.sort(key=lambda pii: (self.PRIORITY[pii.type], -pii.start_pos))
+        return masked_text, detected
+    
+    def _resolve_priority(self, text: str, pii_type: PiiType, start: int, end: int) -> Tuple[PiiType, int, int]:
+        """
+        The combined scan returns the leftmost match. If a higher-priority
+        pattern matches starting inside that span, it wins the overlap.
+        Only positions within the (short) span are probed.
+        """
+        while True:
+            for higher in list(self.PATTERNS)[:self.PRIORITY[pii_type]]:
+                pattern = self.PATTERNS[higher]
+                match = next(
+                    (m for m in (pattern.match(text, i) for i in range(start + 1, end)) if m), None
                 )
-                detected.append(pii)
-                
-                # Replace in text
-                text = text[:match.start()] + pii.replacement + text[match.end():]
+                if match:
+                    pii_type, start, end = higher, match.start(), match.end()
+                    break
+            else:
+                return pii_type, start, end
+    
+    @staticmethod
+    def _replace_spans(text: str, detected: List[PiiMatch]) -> str:
+        """Build the masked text with one join over non-overlapping spans"""
+        pieces = []
+        last = 0
+        for pii in sorted(detected, key=lambda p: p.start_pos):
+            pieces.append(text[last:pii.start_pos])
+            pieces.append(pii.replacement)
+            last = pii.end_pos
+        pieces.append(text[last:])
+        return "".join(pieces)
+    
+    @staticmethod
+    def _restore_offsets(ner_pii: List[PiiMatch], regex_pii: List[PiiMatch]) -> None:
+        """
+        NER runs on regex-masked text; map its offsets back onto the original.
+        Positions inside a replacement token snap to the replaced span.
+        """
+        if not ner_pii or not regex_pii:
+            return
+        
+        # (masked_start, masked_end, original_start, original_end) per replacement
+        segments = []
+        shift = 0
+        for pii in sorted(regex_pii, key=lambda p: p.start_pos):
+            masked_start = pii.start_pos + shift
+            masked_end = masked_start + len(pii.replacement)
+            segments.append((masked_start, masked_end, pii.start_pos, pii.end_pos))
+            shift = masked_end - pii.end_pos
+        starts = [segment[0] for segment in segments]
+        
+        def to_original(pos: int, is_end: bool) -> int:
+            index = bisect.bisect_right(starts, pos - 1 if is_end else pos) - 1
+            if index < 0:
+                return pos
+            masked_start, masked_end, original_start, original_end = segments[index]
+            if pos < masked_end or (is_end and pos == masked_end):
+                return original_end if is_end else original_start
+            return pos - masked_end + original_end
         
-        return text, detected
+        for pii in ner_pii:
+            pii.start_pos = to_original(pii.start_pos, is_end=False)
+            pii.end_pos = to_original(pii.end_pos, is_end=True)
     
     def _mask_with_ner(self, text: str) -> Tuple[str, List[PiiMatch]]:
         """Apply spaCy NER for name and location detection"""
         if not self.nlp:
             return text, []
         
+        doc = next(iter(self.nlp.pipe([text], disable=self.disabled_pipes)))
+        return self._mask_entities(text, doc)
+    
+    def _mask_entities(self, text: str, doc) -> Tuple[str, List[PiiMatch]]:
+        """Mask PERSON/GPE/LOC entities of a parsed doc with one join"""
         detected = []
-        doc = self.nlp(text)
         
-        # Process entities in reverse order to preserve positions
+        # Reverse order keeps the historical ordering of detected items
         for ent in reversed(doc.ents):
             if ent.label_ == "PERSON":
                 pii_type = PiiType.NAME
@@ -203,11 +328,8 @@ class PiiMasker:
                 confidence=confidence
             )
             detected.append(pii)
-            
-            # Replace in text
-            text = text[:ent.start_char] + pii.replacement + text[ent.end_char:]
         
-        return text, detected
+        return self._replace_spans(text, detected), detected
     
     def get_pii_summary(self, result: MaskingResult) -> Dict[str, int]:
         """Return count of each PII type detected"""
@@ -218,55 +340,343 @@ class PiiMasker:
         return summary
 
 
+class StreamingPiiMasker:
+    """
+    Stateful masker for text arriving in chunks (e.g. ASR partials).
+    Keeps a short lookahead tail unmasked-and-unemitted so PII split across
+    chunk boundaries is still matched, and emits masked text as soon as the
+    prefix before the tail can no longer change.
+    
+    Cuts are placed right after whitespace, never inside a candidate match,
+    so word boundaries see the same context as when masking the whole text.
+    """
+    
+    def __init__(self, masker: "PiiMasker", lookahead: int = 64, max_buffer: int = 4096):
+        """
+        Args:
+            masker: Masker used for each emitted segment
+            lookahead: Characters held back; must exceed the longest structured PII
+            max_buffer: Hard cap on buffered characters for streams without whitespace
+        """
+        self.masker = masker
+        self.lookahead = lookahead
+        self.max_buffer = max(max_buffer, lookahead * 2)
+        self._buffer = ""
+        self.emitted_chars = 0
+        self.pii_count = 0
+        self.pii_by_type: Dict[str, int] = {}
+    
+    def feed(self, chunk: str) -> str:
+        """Add a chunk; returns masked text that is now safe to emit (may be empty)"""
+        self._buffer += chunk
+        return self._emit(self._safe_cut())
+    
+    def flush(self) -> str:
+        """End of stream: mask and emit everything still held back"""
+        return self._emit(len(self._buffer))
+    
+    @property
+    def pending(self) -> int:
+        """Characters received but not yet emitted"""
+        return len(self._buffer)
+    
+    def _safe_cut(self) -> int:
+        """Largest prefix length of the buffer that can be masked independently"""
+        buffer = self._buffer
+        cut = len(buffer) - self.lookahead
+        if cut <= 0:
+            return 0
+        
+        # Same priority-resolved spans the masker would produce for this text
+        _, detected = self.masker._mask_with_regex(buffer)
+        spans = [(pii.start_pos, pii.end_pos) for pii in detected]
+        while cut > 0:
+            previous = cut
+            # Never split a (possibly still growing) match
+            for start, end in spans:
+                if start < cut < end:
+                    cut = start
+                    break
+            # Step back to just after whitespace
+            while cut > 0 and not buffer[cut - 1].isspace():
+                cut -= 1
+            if cut == previous:
+                break
+        
+        if cut == 0 and len(buffer) > self.max_buffer:
+            # No safe boundary in a very long run; bound memory over precision
+            cut = len(buffer) - self.lookahead
+        return cut
+    
+    def _emit(self, cut: int) -> str:
+        if cut <= 0:
+            return ""
+        segment, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        result = self.masker.mask(segment)
+        
+        self.emitted_chars += len(segment)
+        self.pii_count += result.pii_count
+        for pii in result.detected_pii:
+            self.pii_by_type[pii.type.name] = self.pii_by_type.get(pii.type.name, 0) + 1
+        return result.masked_text
+
+
+DEFAULT_PII_AUDIT_LOG_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "pii_audit_log.jsonl"
+)
+
+
+class MaskingAuditStore:
+    """
+    Bounded keep_mapping store.
+    The most recent results stay in memory; older ones are evicted to an
+    append-only JSON-lines file holding only ids, PII type counts and timings
+    (never original or masked text). Running counters keep audit queries O(1).
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None, spill_path: Optional[str] = None):
+        """
+        Args:
+            max_entries: Results kept in memory (env PII_AUDIT_MAX_ENTRIES)
+            spill_path: Append-only file for evicted entries (env PII_AUDIT_LOG_PATH)
+        """
+        self.max_entries = max_entries or int(os.getenv("PII_AUDIT_MAX_ENTRIES", "1000"))
+        self.spill_path = os.path.abspath(
+            spill_path or os.getenv("PII_AUDIT_LOG_PATH", DEFAULT_PII_AUDIT_LOG_PATH)
+        )
+        self.entries: "OrderedDict[str, Tuple[MaskingResult, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # Running totals over every transcript ever recorded (in memory or spilled)
+        self.total_transcripts = 0
+        self.total_pii = 0
+        self.total_processing_ms = 0.0
+        self.pii_by_type: Dict[str, int] = {}
+        self.spilled = 0
+        self.spill_errors = 0
+    
+    @staticmethod
+    def _type_counts(result: MaskingResult) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for pii in result.detected_pii:
+            counts[pii.type.name] = counts.get(pii.type.name, 0) + 1
+        return counts
+    
+    def _apply(self, result: MaskingResult, sign: int) -> None:
+        self.total_transcripts += sign
+        self.total_pii += sign * result.pii_count
+        self.total_processing_ms += sign * result.processing_time_ms
+        for name, count in self._type_counts(result).items():
+            self.pii_by_type[name] = self.pii_by_type.get(name, 0) + sign * count
+    
+    def record(self, transcript_id: str, result: MaskingResult) -> None:
+        """Store a result; re-recording an id still in memory replaces it"""
+        evicted = []
+        with self._lock:
+            previous = self.entries.pop(transcript_id, None)
+            if previous is not None:
+                self._apply(previous[0], -1)
+            self.entries[transcript_id] = (result, datetime.now().isoformat())
+            self._apply(result, 1)
+            while len(self.entries) > self.max_entries:
+                evicted.append(self.entries.popitem(last=False))
+        
+        if evicted:
+            self._spill(evicted)
+    
+    def _spill(self, evicted: List[Tuple[str, Tuple[MaskingResult, str]]]) -> None:
+        """Append evicted entries' metadata to the audit file"""
+        lines = [
+            json.dumps({
+                "transcript_id": transcript_id,
+                "masked_at": masked_at,
+                "pii_count": result.pii_count,
+                "pii_types": self._type_counts(result),
+                "processing_time_ms": round(result.processing_time_ms, 3)
+            })
+            for transcript_id, (result, masked_at) in evicted
+        ]
+        try:
+            os.makedirs(os.path.dirname(self.spill_path), exist_ok=True)
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            with self._lock:
+                self.spilled += len(lines)
+        except OSError as e:
+            with self._lock:
+                self.spill_errors += len(lines)
+            logger.warning(f"Could not write PII audit log {self.spill_path}: {e}")
+    
+    def get(self, transcript_id: str) -> Optional[MaskingResult]:
+        """In-memory result for a transcript, if not yet evicted"""
+        with self._lock:
+            entry = self.entries.get(transcript_id)
+            return entry[0] if entry else None
+    
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate audit counters (O(number of PII types))"""
+        with self._lock:
+            return {
+                "total_transcripts_masked": self.total_transcripts,
+                "total_pii_detected": self.total_pii,
+                "pii_by_type": {name: count for name, count in self.pii_by_type.items() if count},
+                "avg_processing_time_ms": round(self.total_processing_ms / self.total_transcripts, 3)
+                if self.total_transcripts else 0.0,
+                "in_memory": len(self.entries),
+                "spilled_to_disk": self.spilled,
+                "spill_errors": self.spill_errors,
+                "audit_log_path": self.spill_path
+            }
+
+
 class PiiMaskingPipeline:
     """
     Orchestrates PII masking across entire processing pipeline.
     Ensures PII is masked before LLM/RAG processing.
+    Results are cached by text digest so each distinct text is masked once
+    per process, whichever process_* method asks for it first.
     """
     
-    def __init__(self, enable_ner: bool = True, keep_mapping: bool = False):
+    def __init__(self, enable_ner: bool = True, keep_mapping: bool = False,
+                 cache_size: Optional[int] = None):
         """
         Initialize masking pipeline.
         
         Args:
             enable_ner: Enable spaCy NER for name detection
             keep_mapping: Keep PII->replacement mapping in memory (for audit purposes only)
+            cache_size: Masking results kept in memory (env PII_MASK_CACHE_SIZE, 0 disables)
         """
         self.masker = PiiMasker(enable_ner=enable_ner)
         self.keep_mapping = keep_mapping
-        self.masked_items: Dict[str, MaskingResult] = {}
+        self.audit_store = MaskingAuditStore() if keep_mapping else None
+        
+        self.cache_size = cache_size if cache_size is not None else int(os.getenv("PII_MASK_CACHE_SIZE", "1024"))
+        self._cache: "OrderedDict[bytes, MaskingResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
-    def process_transcript(self, transcript_id: str, transcript: str) -> MaskingResult:
+    def mask(self, text: str, use_cache: bool = True) -> MaskingResult:
+        """
+        Mask one text.
+        
+        Args:
+            text: Input text
+            use_cache: Set False when the original must not be retained in memory
+        """
+        return self.mask_many([text], use_cache=use_cache)[0]
+    
+    def mask_many(self, texts: List[str], use_cache: bool = True) -> List[MaskingResult]:
+        """
+        Mask a batch of texts in one NER pass.
+        Prefer this over repeated process_* calls when several texts are ready
+        together (both sides of a turn, all turns of a transcript).
+        Cached texts are served from memory; the rest are batched together.
+        
+        Returns:
+            One MaskingResult per input text, in order. Results may be shared
+            with other callers and must not be modified.
+        """
+        use_cache = use_cache and self.cache_size > 0
+        results: List[Optional[MaskingResult]] = [None] * len(texts)
+        pending: Dict[bytes, List[int]] = {}
+        
+        for i, text in enumerate(texts):
+            key = self._digest(text)
+            cached = self._cache_get(key) if use_cache else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+        
+        if pending:
+            keys = list(pending)
+            computed = self.masker.mask_many([texts[pending[key][0]] for key in keys])
+            for key, result in zip(keys, computed):
+                for i in pending[key]:
+                    results[i] = result
+                if use_cache:
+                    self._cache_set(key, result)
+        
+        return results
+    
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[MaskingResult]:
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return result
+    
+    def _cache_set(self, key: bytes, result: MaskingResult) -> None:
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached results (and the originals they hold)"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Masking cache statistics"""
+        with self._cache_lock:
+            lookups = self.cache_hits + self.cache_misses
+            return {
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "hit_ratio": round(self.cache_hits / lookups, 3) if lookups else 0.0
+            }
+    
+    def process_transcript(self, transcript_id: str, transcript: str,
+                           use_cache: bool = True) -> MaskingResult:
         """
         Mask PII in transcript before processing.
         
         Args:
             transcript_id: Unique identifier for transcript
             transcript: Raw transcript text
+            use_cache: Set False to keep the original out of the masking cache
             
         Returns:
             MaskingResult with masked text for downstream processing
         """
-        result = self.masker.mask(transcript)
+        result = self.mask(transcript, use_cache=use_cache)
         
-        if self.keep_mapping:
-            self.masked_items[transcript_id] = result
+        if self.audit_store is not None:
+            self.audit_store.record(transcript_id, result)
             logger.info(f"Transcript {transcript_id}: {result.pii_count} PII items masked")
         
         return result
     
-    def process_for_llm(self, transcript: str) -> str:
+    def stream_masker(self, lookahead: int = 64) -> StreamingPiiMasker:
+        """New streaming masker for one chunked text stream (e.g. one speaker's ASR partials)"""
+        return StreamingPiiMasker(self.masker, lookahead=lookahead)
+    
+    def process_for_llm(self, transcript: str, use_cache: bool = True) -> str:
         """Get masked text safe for LLM processing"""
-        result = self.masker.mask(transcript)
+        result = self.mask(transcript, use_cache=use_cache)
         return result.masked_text
     
-    def process_for_rag(self, transcript: str) -> str:
+    def process_for_rag(self, transcript: str, use_cache: bool = True) -> str:
         """Get masked text safe for RAG/vector DB processing"""
-        result = self.masker.mask(transcript)
+        result = self.mask(transcript, use_cache=use_cache)
         return result.masked_text
     
     def process_for_storage(self, transcript_id: str, transcript: str, 
-                           encrypt_original: bool = False) -> Dict[str, Any]:
+                           encrypt_original: bool = False,
+                           use_cache: bool = True) -> Dict[str, Any]:
         """
         Process transcript for storage.
         Supports optional encryption of original PII.
@@ -275,11 +685,12 @@ class PiiMaskingPipeline:
             transcript_id: Unique ID for tracking
             transcript: Original transcript
             encrypt_original: Whether to encrypt original (not implemented - use external service)
+            use_cache: Set False to keep the original out of the masking cache
             
         Returns:
             Dictionary with masked text and metadata
         """
-        result = self.masker.mask(transcript)
+        result = self.mask(transcript, use_cache=use_cache)
         
         storage_record = {
             "transcript_id": transcript_id,
@@ -296,11 +707,13 @@ class PiiMaskingPipeline:
     
     def get_audit_log(self) -> Dict[str, Any]:
         """Get audit log of masking operations"""
-        return {
-            "total_transcripts_masked": len(self.masked_items),
-            "total_pii_detected": sum(r.pii_count for r in self.masked_items.values()),
-            "timestamp": datetime.now().isoformat()
-        }
+        if self.audit_store is None:
+            return {
+                "total_transcripts_masked": 0,
+                "total_pii_detected": 0,
+                "timestamp": datetime.now().isoformat()
+            }
+        return {**self.audit_store.summary(), "timestamp": datetime.now().isoformat()}
 
 
 # Singleton instance for pipeline
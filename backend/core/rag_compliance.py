@@ -9,16 +9,33 @@ Architecture Decision: Separate RAG into its own layer to:
 """
 
 import os
+import re
 import json
+import time
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Hashable
 from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows: the embedding cache falls back to in-process locking
+    FCNTL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_EMBEDDING_CACHE_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "embedding_cache"
+)
+
 
 @dataclass
 class PolicyDocument:
@@ -33,21 +50,272 @@ class PolicyDocument:
     relevance_score: float = 0.0
 
 
+class LRUTTLCache:
+    """
+    Thread-safe bounded cache with LRU eviction, per-entry TTL and
+    hit/miss counters. Keys are compared exactly (no hashing shortcuts).
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+
+
+class EmbeddingDiskCache:
+    """
+    Content-hash keyed, memory-mapped embedding store.
+    One directory per model holds a raw float32 vector file (read through
+    np.memmap) and a JSON index of text-hash -> row, so policy embeddings
+    survive restarts and unchanged policies are never re-encoded.
+    Writers take an exclusive lock file and merge the on-disk index before
+    appending, so processes sharing the directory don't drop each other's
+    rows; once the file would pass max_rows it is compacted to the rows this
+    process uses plus the newest others.
+    """
+    
+    VECTORS_FILE = "vectors.f32"
+    INDEX_FILE = "index.json"
+    LOCK_FILE = ".lock"
+    COMPACT_MIN_DEAD_ROWS = 1024
+    
+    def __init__(self, model_name: str, cache_dir: Optional[str] = None, max_rows: Optional[int] = None):
+        base_dir = cache_dir or os.getenv("EMBEDDING_CACHE_DIR", DEFAULT_EMBEDDING_CACHE_DIR)
+        safe_model = re.sub(r"[^A-Za-z0-9_.-]+", "__", model_name)
+        self.directory = os.path.abspath(os.path.join(base_dir, safe_model))
+        self.vectors_path = os.path.join(self.directory, self.VECTORS_FILE)
+        self.index_path = os.path.join(self.directory, self.INDEX_FILE)
+        self.lock_path = os.path.join(self.directory, self.LOCK_FILE)
+        self.max_rows = max_rows or int(os.getenv("EMBEDDING_CACHE_MAX_ROWS", "50000"))
+        self.dim: Optional[int] = None
+        self.rows: Dict[str, int] = {}
+        self._mmap: Optional[np.memmap] = None
+        # Hashes this process has read or written; kept first when compacting
+        self._used: set = set()
+        self._lock = threading.Lock()
+        self.enabled = True
+        self._load_index()
+    
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Stable content key for a policy text"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Thread lock plus, where fcntl exists, a shared/exclusive flock on the lock file"""
+        with self._lock:
+            if not FCNTL_AVAILABLE or (not exclusive and not os.path.isdir(self.directory)):
+                yield
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _stored_rows(self) -> int:
+        if self.dim is None or not os.path.exists(self.vectors_path):
+            return 0
+        return os.path.getsize(self.vectors_path) // (4 * self.dim)
+    
+    def _load_index(self) -> None:
+        try:
+            with self._locked(exclusive=False):
+                self._read_index()
+        except OSError as e:
+            logger.warning(f"Embedding cache lock unavailable, reading without it: {e}")
+            self._read_index()
+    
+    def _read_index(self) -> None:
+        """
+        Read the row index and map the vector file it describes together, so
+        a concurrent compaction can't pair one with the other's successor.
+        Rows the vector file cannot back are discarded.
+        """
+        self.rows = {}
+        self._mmap = None
+        if not os.path.exists(self.index_path) or not os.path.exists(self.vectors_path):
+            return
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+            self.dim = int(index["dim"])
+            stored_rows = self._stored_rows()
+            if stored_rows < index.get("count", 0):
+                # Vector file shrank under this index: a compaction died before rewriting it
+                logger.warning("Embedding cache index is stale, starting empty")
+                return
+            self.rows = {h: r for h, r in index["rows"].items() if r < stored_rows}
+            if stored_rows:
+                self._mmap = np.memmap(self.vectors_path, dtype=np.float32, mode="r",
+                                       shape=(stored_rows, self.dim))
+        except Exception as e:
+            logger.warning(f"Embedding cache index unreadable, starting empty: {e}")
+            self.dim = None
+            self.rows = {}
+    
+    def _write_index(self, count: int) -> None:
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"dim": self.dim, "count": count, "rows": self.rows}, f)
+        os.replace(tmp_path, self.index_path)
+    
+    def _compact(self, limit: int) -> int:
+        """Rewrite the vector file keeping at most limit rows; returns the new row count"""
+        # Rows in use by this process first, then newest first
+        ranked = sorted(self.rows.items(), key=lambda item: (item[0] in self._used, item[1]), reverse=True)
+        keep = sorted(ranked[:max(limit, 0)], key=lambda item: item[1])
+        tmp_path = f"{self.vectors_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            if keep:
+                f.write(np.ascontiguousarray(self._mmap[[row for _, row in keep]]).tobytes())
+        dropped = self._stored_rows() - len(keep)
+        os.replace(tmp_path, self.vectors_path)
+        self._mmap = None
+        self.rows = {text_hash: n for n, (text_hash, _) in enumerate(keep)}
+        logger.info(f"Compacted embedding cache to {len(keep)} rows ({dropped} dropped)")
+        return len(keep)
+    
+    def get_many(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for the hashes that are present"""
+        with self._lock:
+            if not self.enabled or self._mmap is None:
+                return {}
+            found = {h: self.rows[h] for h in hashes if h in self.rows}
+            self._used.update(found)
+            return {h: np.array(self._mmap[row]) for h, row in found.items()}
+    
+    def put_many(self, hashes: List[str], vectors: np.ndarray) -> None:
+        """Append vectors not already stored and persist the merged index"""
+        if not self.enabled or not hashes:
+            return
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(len(hashes), -1)
+        
+        try:
+            with self._locked(exclusive=True):
+                # Pick up rows other processes appended (or a compaction) since our last read
+                self._read_index()
+                if self.dim is None:
+                    self.dim = vectors.shape[1]
+                elif vectors.shape[1] != self.dim:
+                    logger.warning(f"Embedding cache dimension mismatch ({vectors.shape[1]} != {self.dim}), skipping write")
+                    return
+                self._used.update(hashes)
+                new: Dict[str, np.ndarray] = {}
+                for text_hash, vector in zip(hashes, vectors):
+                    if text_hash not in self.rows:
+                        new[text_hash] = vector
+                if not new:
+                    return
+                
+                start_row = self._stored_rows()
+                dead_rows = start_row - len(self.rows)
+                if start_row + len(new) > self.max_rows or \
+                        dead_rows > max(len(self.rows), self.COMPACT_MIN_DEAD_ROWS):
+                    start_row = self._compact(self.max_rows - len(new))
+                with open(self.vectors_path, "ab") as f:
+                    f.truncate(start_row * 4 * self.dim)
+                    f.write(np.stack(list(new.values())).tobytes())
+                for offset, text_hash in enumerate(new):
+                    self.rows[text_hash] = start_row + offset
+                self._write_index(start_row + len(new))
+                self._read_index()
+        except OSError as e:
+            logger.warning(f"Embedding cache disabled, could not write to {self.directory}: {e}")
+            self.enabled = False
+
+
 class EmbeddingProvider:
     """Handles text embedding using sentence-transformers"""
     
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 cache_dir: Optional[str] = None, use_disk_cache: bool = True):
         """Initialize embedding model"""
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name)
+        self.disk_cache = EmbeddingDiskCache(model_name, cache_dir) if use_disk_cache else None
         logger.info(f"Embedding model loaded: {model_name}")
     
     def embed_text(self, text: str) -> np.ndarray:
         """Convert text to embedding"""
         return self.model.encode(text, convert_to_numpy=True)
     
-    def embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[np.ndarray]:
         """Embed multiple texts efficiently"""
-        return self.model.encode(texts, convert_to_numpy=True, batch_size=32)
+        return self.model.encode(texts, convert_to_numpy=True, batch_size=batch_size)
+    
+    def embed_documents(self, texts: List[str], batch_size: int = 32) -> List[np.ndarray]:
+        """
+        Embed policy documents through the on-disk cache.
+        Cache misses are encoded together in a single embed_batch call.
+        """
+        if not self.disk_cache:
+            return list(self.embed_batch(texts, batch_size)) if texts else []
+        
+        hashes = [EmbeddingDiskCache.text_hash(t) for t in texts]
+        cached = self.disk_cache.get_many(hashes)
+        
+        missing: Dict[str, str] = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in cached and text_hash not in missing:
+                missing[text_hash] = text
+        
+        if missing:
+            new_vectors = np.asarray(self.embed_batch(list(missing.values()), batch_size), dtype=np.float32)
+            self.disk_cache.put_many(list(missing.keys()), new_vectors)
+            cached.update(zip(missing.keys(), new_vectors))
+            logger.info(f"Embedded {len(missing)} new policies ({len(texts) - len(missing)} from cache)")
+        
+        return [cached[h] for h in hashes]
     
     def similarity_score(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """Calculate cosine similarity between embeddings"""
@@ -55,26 +323,158 @@ class EmbeddingProvider:
                     (np.linalg.norm(embedding1) * np.linalg.norm(embedding2)))
 
 
+class PolicyMatrixIndex:
+    """
+    Contiguous float32 matrix of L2-normalized policy embeddings.
+    Rows are kept dense (swap-with-last on removal) so a search is one
+    matmul over the live rows plus an argpartition top-k.
+    """
+    
+    def __init__(self, initial_capacity: int = 64):
+        self._capacity = max(1, initial_capacity)
+        self._matrix: Optional[np.ndarray] = None
+        self._size = 0
+        self.id_to_row: Dict[str, int] = {}
+        self.row_to_id: List[str] = []
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __contains__(self, policy_id: str) -> bool:
+        return policy_id in self.id_to_row
+    
+    @staticmethod
+    def normalize(vector: np.ndarray) -> np.ndarray:
+        """Return a float32 unit vector (zero vectors are left as zeros)"""
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+    
+    def _ensure_capacity(self, dim: int, needed: int) -> None:
+        """Allocate or grow the backing matrix geometrically"""
+        if self._matrix is None:
+            self._capacity = max(self._capacity, needed)
+            self._matrix = np.zeros((self._capacity, dim), dtype=np.float32)
+            return
+        if self._matrix.shape[1] != dim:
+            raise ValueError(f"Embedding dimension mismatch: index has {self._matrix.shape[1]}, got {dim}")
+        if needed <= self._capacity:
+            return
+        while self._capacity < needed:
+            self._capacity *= 2
+        grown = np.zeros((self._capacity, dim), dtype=np.float32)
+        grown[:self._size] = self._matrix[:self._size]
+        self._matrix = grown
+    
+    def upsert(self, policy_id: str, embedding: np.ndarray) -> None:
+        """Insert or replace a single policy vector in O(dim) amortized"""
+        vector = self.normalize(embedding)
+        row = self.id_to_row.get(policy_id)
+        if row is not None:
+            self._matrix[row] = vector
+            return
+        self._ensure_capacity(vector.shape[0], self._size + 1)
+        self._matrix[self._size] = vector
+        self.id_to_row[policy_id] = self._size
+        self.row_to_id.append(policy_id)
+        self._size += 1
+    
+    def upsert_many(self, policy_ids: List[str], embeddings: np.ndarray) -> None:
+        """Insert or replace many vectors, growing the matrix at most once"""
+        if not policy_ids:
+            return
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(policy_ids), -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        
+        new_count = sum(1 for pid in dict.fromkeys(policy_ids) if pid not in self.id_to_row)
+        self._ensure_capacity(vectors.shape[1], self._size + new_count)
+        for policy_id, vector in zip(policy_ids, vectors):
+            row = self.id_to_row.get(policy_id)
+            if row is None:
+                row = self._size
+                self.id_to_row[policy_id] = row
+                self.row_to_id.append(policy_id)
+                self._size += 1
+            self._matrix[row] = vector
+    
+    def remove(self, policy_id: str) -> bool:
+        """Remove a policy vector by moving the last row into its slot"""
+        row = self.id_to_row.pop(policy_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if row != last:
+            moved_id = self.row_to_id[last]
+            self._matrix[row] = self._matrix[last]
+            self.row_to_id[row] = moved_id
+            self.id_to_row[moved_id] = row
+        self.row_to_id.pop()
+        self._size -= 1
+        return True
+    
+    def search(self, query_embedding: np.ndarray, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Return (policy_id, cosine score) pairs for the top-k rows, best first"""
+        if self._size == 0 or top_k <= 0:
+            return []
+        query = self.normalize(query_embedding)
+        scores = self._matrix[:self._size] @ query
+        k = min(top_k, self._size)
+        if k < self._size:
+            top_rows = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top_rows = np.arange(self._size)
+        top_rows = top_rows[np.argsort(-scores[top_rows], kind="stable")]
+        return [(self.row_to_id[row], float(scores[row])) for row in top_rows]
+
+
 class LocalPolicyStore:
-    """In-memory policy store with FAISS-like functionality"""
+    """In-memory policy store backed by a normalized embedding matrix"""
     
     def __init__(self, embedding_provider: EmbeddingProvider):
         self.policies: Dict[str, PolicyDocument] = {}
         self.embeddings = embedding_provider
-        self.policy_embeddings: Dict[str, np.ndarray] = {}
+        self.index = PolicyMatrixIndex()
+        self.version = 0  # Bumped on every mutation; keys cached search results
     
     def add_policy(self, policy: PolicyDocument) -> None:
         """Add policy to store"""
-        policy.embedding = self.embeddings.embed_text(policy.content)
+        if policy.embedding is None:
+            policy.embedding = self.embeddings.embed_documents([policy.content])[0]
         self.policies[policy.id] = policy
-        self.policy_embeddings[policy.id] = policy.embedding
+        self.index.upsert(policy.id, policy.embedding)
+        self.version += 1
         logger.info(f"Policy added: {policy.title}")
     
+    def add_policies(self, policies: List[PolicyDocument], batch_size: int = 256) -> int:
+        """
+        Bulk-add policies, embedding them in batches through embed_documents.
+        Returns the number of policies added or replaced.
+        """
+        for start in range(0, len(policies), batch_size):
+            chunk = policies[start:start + batch_size]
+            pending = [p for p in chunk if p.embedding is None]
+            if pending:
+                embeddings = self.embeddings.embed_documents([p.content for p in pending])
+                for policy, embedding in zip(pending, embeddings):
+                    policy.embedding = embedding
+            
+            for policy in chunk:
+                self.policies[policy.id] = policy
+            self.index.upsert_many([p.id for p in chunk], np.stack([p.embedding for p in chunk]))
+        
+        if policies:
+            self.version += 1
+        
+        logger.info(f"Bulk-added {len(policies)} policies")
+        return len(policies)
+    
     def remove_policy(self, policy_id: str) -> None:
         """Remove policy from store"""
         if policy_id in self.policies:
             del self.policies[policy_id]
-            del self.policy_embeddings[policy_id]
+            self.index.remove(policy_id)
+            self.version += 1
             logger.info(f"Policy removed: {policy_id}")
     
     def search(self, query: str, top_k: int = 5) -> List[Tuple[PolicyDocument, float]]:
@@ -83,15 +483,11 @@ class LocalPolicyStore:
             return []
         
         query_embedding = self.embeddings.embed_text(query)
-        scores = {}
-        
-        for policy_id, policy_embedding in self.policy_embeddings.items():
-            score = self.embeddings.similarity_score(query_embedding, policy_embedding)
-            scores[policy_id] = score
-        
-        # Return top-k policies sorted by relevance
-        top_policies = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
-        return [(self.policies[pid], score) for pid, score in top_policies]
+        return self.search_by_embedding(query_embedding, top_k)
+    
+    def search_by_embedding(self, query_embedding: np.ndarray, top_k: int = 5) -> List[Tuple[PolicyDocument, float]]:
+        """Search with a precomputed query embedding"""
+        return [(self.policies[pid], score) for pid, score in self.index.search(query_embedding, top_k)]
     
     def get_by_category(self, category: str) -> List[PolicyDocument]:
         """Get all policies in a category"""
@@ -101,11 +497,16 @@ class LocalPolicyStore:
 class ComplianceRAGEnhanced:
     """Enterprise-grade RAG system for compliance checking"""
     
-    def __init__(self, use_local_store: bool = True):
+    def __init__(self, use_local_store: bool = True,
+                 cache_size: int = 1024, cache_ttl_seconds: float = 600.0):
         """Initialize RAG system"""
         self.embedding_provider = EmbeddingProvider()
         self.policy_store = LocalPolicyStore(self.embedding_provider) if use_local_store else None
-        self.query_cache: Dict[str, List[PolicyDocument]] = {}
+        # Query text -> embedding (policy independent)
+        self.embedding_cache = LRUTTLCache(maxsize=cache_size, ttl_seconds=cache_ttl_seconds)
+        # (policy version, query text, top_k) -> (policies, scores); stale
+        # versions are never looked up again and age out through LRU/TTL
+        self.query_cache = LRUTTLCache(maxsize=cache_size, ttl_seconds=cache_ttl_seconds)
         self._load_default_policies()
     
     def _load_default_policies(self) -> None:
@@ -122,18 +523,21 @@ class ComplianceRAGEnhanced:
             
             # Parse policies (simple format: title | category | severity | content)
             policies = content.split("---")
+            parsed = []
             for i, policy_text in enumerate(policies):
                 lines = policy_text.strip().split("\n", 3)
                 if len(lines) >= 4:
-                    policy = PolicyDocument(
+                    parsed.append(PolicyDocument(
                         id=f"policy_{i}",
                         title=lines[0].strip(),
                         category=lines[1].strip(),
                         severity=lines[2].strip(),
                         content=lines[3].strip(),
                         created_at=datetime.now()
-                    )
-                    self.policy_store.add_policy(policy)
+                    ))
+            
+            # Cached embeddings come from disk, changed ones are batch-encoded
+            self.policy_store.add_policies(parsed)
             
             logger.info(f"Loaded {len(policies)} policies from policy.txt")
         except Exception as e:
@@ -144,13 +548,7 @@ class ComplianceRAGEnhanced:
         Get most relevant compliance rules for given context.
         Returns formatted string of relevant policies.
         """
-        cache_key = hash(context) % 100000
-        
-        if cache_key in self.query_cache:
-            results = self.query_cache[cache_key]
-        else:
-            results, scores = self.search_policies(context, top_k)
-            self.query_cache[cache_key] = results
+        results, _ = self.search_policies(context, top_k)
         
         if not results:
             return "No relevant policies found. Default: Follow customer protection regulations."
@@ -167,15 +565,26 @@ class ComplianceRAGEnhanced:
         Search policies with relevance scores.
         Returns (policies, scores)
         """
-        if not self.policy_store:
+        if not self.policy_store or not self.policy_store.policies:
             return [], []
         
-        results = self.policy_store.search(query, top_k)
+        cache_key = (self.policy_store.version, query, top_k)
+        cached = self.query_cache.get(cache_key)
+        if cached is not None:
+            return list(cached[0]), list(cached[1])
+        
+        query_embedding = self.embedding_cache.get(query)
+        if query_embedding is None:
+            query_embedding = self.embedding_provider.embed_text(query)
+            self.embedding_cache.set(query, query_embedding)
+        
+        results = self.policy_store.search_by_embedding(query_embedding, top_k)
         policies = [p for p, _ in results]
         scores = [s for _, s in results]
+        self.query_cache.set(cache_key, (policies, scores))
         
         logger.debug(f"Policy search returned {len(policies)} results")
-        return policies, scores
+        return list(policies), list(scores)
     
     def validate_compliance(self, text: str, strategy: str = "strict") -> Dict[str, Any]:
         """
@@ -220,9 +629,32 @@ class ComplianceRAGEnhanced:
             created_at=datetime.now()
         )
         self.policy_store.add_policy(policy)
-        self.query_cache.clear()  # Clear cache when policies change
         return policy_id
     
+    def add_custom_policies(self, policies: List[Dict[str, str]], batch_size: int = 256) -> List[str]:
+        """
+        Bulk-import a policy pack at runtime.
+        Each entry needs title, content, category and severity; an optional id
+        replaces an existing policy with the same id.
+        """
+        if not self.policy_store:
+            return []
+        
+        timestamp = datetime.now().timestamp()
+        documents = [
+            PolicyDocument(
+                id=entry.get("id") or f"custom_{timestamp}_{i}",
+                title=entry["title"],
+                content=entry["content"],
+                category=entry.get("category", "general"),
+                severity=entry.get("severity", "medium"),
+                created_at=datetime.now()
+            )
+            for i, entry in enumerate(policies)
+        ]
+        self.policy_store.add_policies(documents, batch_size=batch_size)
+        return [d.id for d in documents]
+    
     def get_policy_summary(self) -> Dict[str, Any]:
         """Get summary of loaded policies"""
         if not self.policy_store:
@@ -244,6 +676,14 @@ class ComplianceRAGEnhanced:
             "by_category": categories,
             "by_severity": severities
         }
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics for the query embedding and result caches"""
+        return {
+            "policy_version": self.policy_store.version if self.policy_store else 0,
+            "query_embeddings": self.embedding_cache.stats(),
+            "search_results": self.query_cache.stats()
+        }
 
 
 # Backward compatibility with existing code
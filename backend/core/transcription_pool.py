@@ -0,0 +1,382 @@
+"""
+Transcription Worker Pool
+Runs Whisper in a pool of worker processes, each loading the model once.
+
+Architecture Decision: Move transcription out of the API/watcher process to:
+1. Scale throughput with CPU cores instead of sharing one model object
+2. Keep the event loop free while long files are decoded and transcribed
+3. Apply backpressure with a bounded job queue (callers get a clear "busy")
+4. Bound every job with a timeout
+5. Split long files into overlapping windows transcribed in parallel, so the
+   first part of a long call is available long before the whole file is done
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from collections import Counter
+from typing import Dict, Optional, Tuple, Any, AsyncIterator, Callable, List
+
+from backend.core.multilingual_transcribe import (
+    WhisperTranscriber, TranscriptionResult, TranslationService, SupportedLanguage,
+    translate_result, probe_audio_duration, plan_chunks, trim_to_window,
+    WHISPER_AVAILABLE, MAX_CHUNKED_AUDIO_DURATION
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionQueueFullError(RuntimeError):
+    """Raised when the job queue is full; callers should retry later"""
+
+
+class TranscriptionTimeoutError(RuntimeError):
+    """Raised when a job does not finish within its timeout"""
+
+
+# ==================== WORKER PROCESS ====================
+
+# Loaded once per worker process by _init_worker
+_worker_transcriber: Optional[WhisperTranscriber] = None
+
+
+def _init_worker(model_name: str, torch_threads: int) -> None:
+    """Worker initializer: pin torch threads and load the Whisper model"""
+    global _worker_transcriber
+    if torch_threads > 0:
+        try:
+            import torch
+            torch.set_num_threads(torch_threads)
+        except ImportError:
+            pass
+    _worker_transcriber = WhisperTranscriber(model_name=model_name)
+
+
+def _transcribe_job(audio_path: str) -> TranscriptionResult:
+    return _worker_transcriber.transcribe(audio_path)
+
+
+def _transcribe_window_job(audio_path: str, start: float, duration: float) -> TranscriptionResult:
+    return _worker_transcriber.transcribe_window(audio_path, start, duration)
+
+
+def _ping_job() -> int:
+    return os.getpid()
+
+
+# ==================== POOL ====================
+
+class TranscriptionWorkerPool:
+    """
+    Pool of Whisper worker processes with a bounded job queue.
+    At most workers + queue_size jobs are accepted at once; further submits
+    raise TranscriptionQueueFullError. A job that times out while still queued
+    is cancelled; one already running keeps its slot until the worker finishes.
+    Translation of non-English results runs in the calling process so the
+    translation model is loaded once, not per worker.
+    
+    Files longer than 1.5 chunk windows are transcribed in chunked mode: fixed
+    windows overlapping by a few seconds, at most `workers` in flight per file,
+    stitched by segment timestamps so overlapping speech is kept only once.
+    """
+    
+    def __init__(self,
+                 whisper_model: str = "base",
+                 auto_translate: bool = True,
+                 workers: Optional[int] = None,
+                 queue_size: Optional[int] = None,
+                 job_timeout: Optional[float] = None,
+                 chunk_seconds: Optional[float] = None,
+                 chunk_overlap: Optional[float] = None):
+        """
+        Args:
+            whisper_model: Whisper model size loaded in every worker
+            auto_translate: Translate non-English transcripts to English
+            workers: Worker processes (env TRANSCRIBE_WORKERS, default half the cores)
+            queue_size: Jobs waiting beyond those running (env TRANSCRIBE_QUEUE_SIZE)
+            job_timeout: Seconds before a job is abandoned (env TRANSCRIBE_TIMEOUT_SECONDS)
+            chunk_seconds: Window length in chunked mode (env TRANSCRIBE_CHUNK_SECONDS)
+            chunk_overlap: Overlap between windows (env TRANSCRIBE_CHUNK_OVERLAP_SECONDS)
+        """
+        cpu_count = os.cpu_count() or 2
+        self.whisper_model = whisper_model
+        self.auto_translate = auto_translate
+        self.workers = workers or int(os.getenv("TRANSCRIBE_WORKERS", str(max(1, cpu_count // 2))))
+        self.queue_size = queue_size if queue_size is not None else int(os.getenv("TRANSCRIBE_QUEUE_SIZE", "8"))
+        self.job_timeout = job_timeout or float(os.getenv("TRANSCRIBE_TIMEOUT_SECONDS", "600"))
+        self.chunk_seconds = chunk_seconds or float(os.getenv("TRANSCRIBE_CHUNK_SECONDS", "60"))
+        self.chunk_overlap = chunk_overlap if chunk_overlap is not None else float(
+            os.getenv("TRANSCRIBE_CHUNK_OVERLAP_SECONDS", "2"))
+        self.max_pending = self.workers + self.queue_size
+        # Split cores between workers so torch threads don't oversubscribe the CPU
+        self.torch_threads = max(1, cpu_count // self.workers)
+        
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._translator: Optional[TranslationService] = None
+        self._translator_lock = threading.Lock()
+        
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.chunked_files = 0
+    
+    def start(self) -> None:
+        """Start worker processes (idempotent); models load in the background"""
+        with self._lock:
+            if self._executor is not None:
+                return
+            if not WHISPER_AVAILABLE:
+                raise ImportError("whisper not installed. Install with: pip install openai-whisper")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.whisper_model, self.torch_threads)
+            )
+            executor = self._executor
+        
+        # Spawn every worker now so model loading doesn't delay the first requests
+        for _ in range(self.workers):
+            executor.submit(_ping_job)
+        logger.info(f"Transcription pool started: {self.workers} workers, "
+                    f"queue {self.queue_size}, model {self.whisper_model}")
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop worker processes, cancelling queued jobs"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("Transcription pool stopped")
+    
+    def _submit_job(self, job: Callable, *args,
+                    count_rejection: bool = True) -> Tuple[Future, ProcessPoolExecutor]:
+        """Reserve a queue slot and hand the job to a worker"""
+        self.start()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                if count_rejection:
+                    self.rejected += 1
+                raise TranscriptionQueueFullError(
+                    f"Transcription queue full ({self._pending} jobs pending)"
+                )
+            self._pending += 1
+            executor = self._executor
+        
+        try:
+            future = executor.submit(job, *args)
+        except BrokenProcessPool:
+            self._release_slot()
+            self._reset_executor(executor)
+            raise
+        except Exception:
+            self._release_slot()
+            raise
+        future.add_done_callback(self._release_slot)
+        return future, executor
+    
+    def _release_slot(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._pending -= 1
+    
+    def _reset_executor(self, broken: ProcessPoolExecutor) -> None:
+        """Drop a broken executor (e.g. a worker was killed); the next submit restarts it"""
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+        logger.error("Transcription worker pool broken; restarting on next job")
+    
+    async def submit(self, audio_path: str, timeout: Optional[float] = None) -> TranscriptionResult:
+        """
+        Transcribe a file on a worker process in a single job.
+        
+        Raises:
+            TranscriptionQueueFullError: Too many jobs pending (backpressure)
+            TranscriptionTimeoutError: Job did not finish in time
+        """
+        future, executor = self._submit_job(_transcribe_job, audio_path)
+        result = await self._await_job(future, executor, os.path.basename(audio_path), timeout)
+        if self.auto_translate:
+            result = await asyncio.to_thread(self._translate, result)
+        return result
+    
+    async def transcribe(self, audio_path: str, timeout: Optional[float] = None) -> TranscriptionResult:
+        """
+        Transcribe a file, using chunked mode when it is long enough to benefit.
+        Files whose duration can't be probed go through a single job.
+        """
+        duration = await asyncio.to_thread(probe_audio_duration, audio_path)
+        if duration is None or duration <= self.chunk_seconds * 1.5:
+            return await self.submit(audio_path, timeout)
+        
+        start_time = time.time()
+        partials = [partial async for partial in self.transcribe_chunked(audio_path, duration, timeout)]
+        languages = Counter(p.detected_language for p in partials)
+        language = languages.most_common(1)[0][0]
+        code = next(p.language_code for p in partials if p.detected_language == language)
+        translated = [p for p in partials if p.is_translated]
+        
+        return TranscriptionResult(
+            transcript=" ".join(p.transcript for p in partials if p.transcript),
+            detected_language=language,
+            language_code=code,
+            confidence=min(p.confidence for p in partials),
+            duration_seconds=duration,
+            is_translated=bool(translated),
+            original_language=translated[0].original_language if translated else None,
+            processing_time_ms=(time.time() - start_time) * 1000,
+            segments=[segment for p in partials for segment in p.segments]
+        )
+    
+    async def transcribe_chunked(self, audio_path: str,
+                                 duration: Optional[float] = None,
+                                 timeout: Optional[float] = None) -> AsyncIterator[TranscriptionResult]:
+        """
+        Transcribe a long file as overlapping windows across the workers,
+        yielding each window's result in order as soon as it and every earlier
+        window are done. Yielded transcripts are already de-duplicated against
+        their neighbours, so joining them gives the full transcript.
+        
+        Raises:
+            ValueError: Duration unknown or above MAX_CHUNKED_AUDIO_DURATION
+            TranscriptionQueueFullError: No slot for the first window
+            TranscriptionTimeoutError: A window did not finish in time
+        """
+        if duration is None:
+            duration = await asyncio.to_thread(probe_audio_duration, audio_path)
+        if duration is None:
+            raise ValueError("Could not determine audio duration for chunked transcription")
+        if duration > MAX_CHUNKED_AUDIO_DURATION:
+            raise ValueError(
+                f"Audio duration ({duration:.1f}s) exceeds maximum allowed ({MAX_CHUNKED_AUDIO_DURATION}s)"
+            )
+        
+        chunks = plan_chunks(duration, self.chunk_seconds, self.chunk_overlap)
+        name = os.path.basename(audio_path)
+        with self._lock:
+            self.chunked_files += 1
+        logger.info(f"Chunked transcription of {name}: {duration:.1f}s in {len(chunks)} windows")
+        
+        in_flight: Dict[int, asyncio.Task] = {}
+        done: Dict[int, TranscriptionResult] = {}
+        next_submit = 0
+        next_yield = 0
+        previous_text = ""
+        try:
+            while next_yield < len(chunks):
+                # Keep up to `workers` windows of this file running; the first
+                # window surfaces queue-full, later ones wait for a free slot
+                while next_submit < len(chunks) and len(in_flight) < self.workers:
+                    start, length = chunks[next_submit]
+                    try:
+                        future, executor = self._submit_job(
+                            _transcribe_window_job, audio_path, start, length,
+                            count_rejection=next_submit == 0
+                        )
+                    except TranscriptionQueueFullError:
+                        if next_submit == 0:
+                            raise
+                        break
+                    in_flight[next_submit] = asyncio.ensure_future(
+                        self._await_job(future, executor, f"{name}@{start:.0f}s", timeout)
+                    )
+                    next_submit += 1
+                
+                if not in_flight:
+                    await asyncio.sleep(0.5)
+                    continue
+                
+                finished, _ = await asyncio.wait(in_flight.values(), return_when=asyncio.FIRST_COMPLETED)
+                for index in [i for i, task in in_flight.items() if task in finished]:
+                    done[index] = in_flight.pop(index).result()
+                
+                while next_yield in done:
+                    result = done.pop(next_yield)
+                    keep_from = chunks[next_yield][0] + self.chunk_overlap / 2 if next_yield else 0.0
+                    keep_until = (chunks[next_yield + 1][0] + self.chunk_overlap / 2
+                                  if next_yield + 1 < len(chunks) else float("inf"))
+                    result = trim_to_window(result, keep_from, keep_until, previous_text)
+                    if self.auto_translate:
+                        result = await asyncio.to_thread(self._translate, result)
+                    if result.transcript:
+                        previous_text = result.transcript
+                    next_yield += 1
+                    yield result
+        finally:
+            for task in in_flight.values():
+                task.cancel()
+    
+    async def _await_job(self, future: Future, executor: ProcessPoolExecutor,
+                         label: str, timeout: Optional[float] = None) -> TranscriptionResult:
+        """Wait for a worker job, counting outcomes (translation is left to callers)"""
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.job_timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timed_out += 1
+            raise TranscriptionTimeoutError(
+                f"Transcription of {label} exceeded {timeout or self.job_timeout:g}s"
+            )
+        except BrokenProcessPool:
+            with self._lock:
+                self.failed += 1
+            self._reset_executor(executor)
+            raise
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        
+        with self._lock:
+            self.completed += 1
+        return result
+    
+    def _translate(self, result: TranscriptionResult) -> TranscriptionResult:
+        """Translate in this process, loading the translation model on first use"""
+        if result.language_code == SupportedLanguage.ENGLISH:
+            return result
+        with self._translator_lock:
+            if self._translator is None:
+                self._translator = TranslationService()
+        return translate_result(result, self._translator)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Pool and queue statistics"""
+        with self._lock:
+            return {
+                "running": self._executor is not None,
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "pending": self._pending,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "chunked_files": self.chunked_files,
+                "chunk_seconds": self.chunk_seconds
+            }
+
+
+# Singleton instance
+_transcription_pool: Optional[TranscriptionWorkerPool] = None
+
+
+def get_transcription_pool(whisper_model: str = "base",
+                           auto_translate: bool = True) -> TranscriptionWorkerPool:
+    """Get or create global transcription pool (workers start on first use or start())"""
+    global _transcription_pool
+    if _transcription_pool is None:
+        _transcription_pool = TranscriptionWorkerPool(
+            whisper_model=whisper_model,
+            auto_translate=auto_translate
+        )
+    return _transcription_pool
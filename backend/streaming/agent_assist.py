@@ -14,6 +14,8 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from backend.core.keyword_matcher import get_keyword_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,17 +82,20 @@ class ScriptValidator:
             "product_knowledge": ["feature", "benefit", "capability"],
             "customer_success": ["training", "tutorial", "resources", "guide"]
         }
+        self.matcher = get_keyword_matcher()
+        self.matcher.register("script_required", self.required_elements)
+        self.matcher.register("script_optional", self.optional_elements)
     
     def validate_conversation(self, dialogue: str) -> Dict[str, Any]:
         """Validate dialogue against script requirements"""
-        dialogue_lower = dialogue.lower()
+        hits = self.matcher.scan(dialogue)
         
         missing_required = []
         found_required = []
         
         # Check required elements
-        for element, keywords in self.required_elements.items():
-            found = any(keyword in dialogue_lower for keyword in keywords)
+        for element in self.required_elements:
+            found = hits.any("script_required", element)
             if found:
                 found_required.append(element)
             else:
@@ -98,8 +103,8 @@ class ScriptValidator:
         
         # Check optional elements
         found_optional = []
-        for element, keywords in self.optional_elements.items():
-            found = any(keyword in dialogue_lower for keyword in keywords)
+        for element in self.optional_elements:
+            found = hits.any("script_optional", element)
             if found:
                 found_optional.append(element)
         
@@ -127,6 +132,18 @@ class RealTimeSuggestionEngine:
         self.script_validator = ScriptValidator()
         self.empathy_keywords = ["understand", "apologize", "appreciate", "help", "concern"]
         self.compliance_keywords = ["privacy", "confidential", "authorized", "verification"]
+        self.turn_keywords = {
+            "concern": ["frustrated", "angry", "concerned", "upset", "confused", "problem", "issue"],
+            "empathy": self.empathy_keywords,
+            "sensitive": ["account number", "ssn", "password", "pin", "credit card"],
+            "verified": ["verified", "confirm your", "what's your", "can you verify"],
+            "further_help": ["is there", "anything else", "can i help"],
+            "solving": ["done", "resolved", "fixed", "set up", "completed", "sent you", "scheduled"],
+            "confused": ["still don't understand", "not clear", "confused", "how", "why"],
+            "question": ["question"]
+        }
+        self.matcher = get_keyword_matcher()
+        self.matcher.register("assist", self.turn_keywords)
     
     def analyze_turn(self, agent_turn: str, customer_turn: str, conversation_history: str = "") -> Dict[str, Any]:
         """
@@ -176,7 +193,7 @@ class RealTimeSuggestionEngine:
             ))
         
         # Check 4: Resolution progress
-        if "question" in customer_turn.lower() or "?" in customer_turn:
+        if self.matcher.scan(customer_turn).any("assist", "question") or "?" in customer_turn:
             resolution_check = self._check_resolution(agent_turn, customer_turn)
             if resolution_check["suggestion"]:
                 suggestions.append(AgentSuggestion(
@@ -196,14 +213,11 @@ class RealTimeSuggestionEngine:
     
     def _check_empathy(self, agent_turn: str, customer_turn: str) -> Dict[str, Any]:
         """Check for empathy in agent response"""
-        agent_lower = agent_turn.lower()
-        customer_lower = customer_turn.lower()
-        
         # Check if customer expressed concern/frustration
-        has_concern = any(word in customer_lower for word in ["frustrated", "angry", "concerned", "upset", "confused", "problem", "issue"])
+        has_concern = self.matcher.scan(customer_turn).any("assist", "concern")
         
         # Check if agent showed empathy
-        has_empathy = any(word in agent_lower for word in self.empathy_keywords)
+        has_empathy = self.matcher.scan(agent_turn).any("assist", "empathy")
         
         if has_concern and not has_empathy:
             return {
@@ -217,15 +231,11 @@ class RealTimeSuggestionEngine:
     
     def _check_compliance(self, agent_turn: str, customer_turn: str) -> Dict[str, Any]:
         """Check for compliance issues"""
-        agent_lower = agent_turn.lower()
-        customer_lower = customer_turn.lower()
-        
         # Check if sensitive data is being discussed without verification
-        sensitive_keywords = ["account number", "ssn", "password", "pin", "credit card"]
-        has_sensitive = any(word in customer_lower for word in sensitive_keywords)
+        has_sensitive = self.matcher.scan(customer_turn).any("assist", "sensitive")
         
         # Check if agent verified customer identity
-        verified = any(word in agent_lower for word in ["verified", "confirm your", "what's your", "can you verify"])
+        verified = self.matcher.scan(agent_turn).any("assist", "verified")
         
         if has_sensitive and not verified:
             return {
@@ -240,13 +250,11 @@ class RealTimeSuggestionEngine:
     
     def _check_script_elements(self, agent_turn: str) -> Dict[str, Any]:
         """Check for missing standard script elements"""
-        agent_lower = agent_turn.lower()
-        
         missing = []
         if "?" not in agent_turn:  # No question asked
             missing.append("open-ended question to drive conversation")
         
-        if not any(word in agent_lower for word in ["is there", "anything else", "can i help"]):
+        if not self.matcher.scan(agent_turn).any("assist", "further_help"):
             missing.append("offer to help further")
         
         return {
@@ -257,15 +265,11 @@ class RealTimeSuggestionEngine:
     
     def _check_resolution(self, agent_turn: str, customer_turn: str) -> Dict[str, Any]:
         """Check if resolution is being achieved"""
-        agent_lower = agent_turn.lower()
-        
         # Check if agent is solving the problem
-        solving_words = ["done", "resolved", "fixed", "set up", "completed", "sent you", "scheduled"]
-        is_solving = any(word in agent_lower for word in solving_words)
+        is_solving = self.matcher.scan(agent_turn).any("assist", "solving")
         
         # Check if customer is confused
-        confused_words = ["still don't understand", "not clear", "confused", "how", "why"]
-        customer_confused = any(word in customer_turn.lower() for word in confused_words)
+        customer_confused = self.matcher.scan(customer_turn).any("assist", "confused")
         
         if customer_confused and not is_solving:
             return {
@@ -6,20 +6,35 @@ Architecture Decision: Central orchestrator that:
   2. Triggers incremental scoring
   3. Owns real-time alerts and suggestions
   4. Coordinates all sub-systems
+  5. Runs independent per-segment analyzers concurrently and joins them
+     only where a later stage needs their results
+  6. Bounds session memory: per-conversation segment/byte caps, a global
+     LRU cap, and a reaper that finalizes sessions left idle (dropped calls)
+  7. Keeps per-segment records slotted and numeric (epoch timestamps, enum
+     codes, integer scores); JSON-shaped dicts are built only when serialized
 """
 
+import os
 import json
+import math
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, asdict
-from collections import deque
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, asdict, field, replace
+from enum import IntEnum
+from collections import deque, OrderedDict
 from datetime import datetime
 import time
 
 # Import all sub-systems
-from backend.core.llm_provider import LLMManager, GroqProvider
+from backend.core.llm_provider import (
+    LLMManager, GroqProvider, LLMBatchScheduler, CircuitOpenError, RateLimitedError
+)
 from backend.core.rag_compliance import ComplianceRAGEnhanced
-from backend.analytics.sentiment_emotion import SentimentEmotionAnalyzer
+from backend.core.keyword_matcher import get_keyword_matcher
+from backend.analytics.sentiment_emotion import SentimentEmotionAnalyzer, ConversationSentimentState
 from backend.analytics.anomaly_detection import AnomalyDetectionEngine
 from backend.streaming.agent_assist import AgentAssistManager
 from backend.streaming.auto_coaching import AutoCoachingEngine
@@ -27,34 +42,505 @@ from backend.streaming.auto_coaching import AutoCoachingEngine
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _iso(timestamp: float) -> str:
+    """Epoch seconds to the ISO string used in API responses"""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _score(value: Any) -> int:
+    return int(round(value)) if isinstance(value, (int, float)) else 0
+
+
+class ComplianceStatus(IntEnum):
+    """Segment compliance status, ordered from best to worst"""
+    PASS = 0
+    WARN = 1
+    FAIL = 2
+    
+    @classmethod
+    def parse(cls, value: Any) -> "ComplianceStatus":
+        """Unknown values count as pass, matching how LLM statuses are ranked"""
+        return cls.__members__.get(str(value).upper(), cls.PASS)
+    
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class Severity(IntEnum):
+    """Policy severity"""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+    
+    @classmethod
+    def parse(cls, value: Any) -> "Severity":
+        """Unknown values count as medium, the default for imported policies"""
+        return cls.__members__.get(str(value).upper(), cls.MEDIUM)
+    
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+@dataclass(slots=True)
 class StreamingSegment:
     """A segment of streaming conversation"""
     segment_id: str
     agent_text: str
     customer_text: str
-    timestamp: str
+    timestamp: float  # epoch seconds
     duration: float  # seconds
 
 
-@dataclass
+@dataclass(slots=True)
+class ComplianceWarning:
+    """A RAG policy match for a segment"""
+    severity: Severity
+    policy: str
+    relevance_score: float
+    guidance: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        severity = self.severity.label
+        return {
+            "level": "warning" if self.severity is Severity.MEDIUM else severity,
+            "policy": self.policy,
+            "message": f"Potential {severity} violation: {self.policy}",
+            "guidance": self.guidance,
+            "relevance_score": self.relevance_score
+        }
+
+
+@dataclass(slots=True)
+class StageTimings:
+    """Wall-clock milliseconds per pipeline stage"""
+    quality: float
+    sentiment: float
+    agent_assist: float
+    compliance: float
+    anomaly_coaching: float
+    total: float
+    
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "quality": round(self.quality, 2),
+            "sentiment": round(self.sentiment, 2),
+            "agent_assist": round(self.agent_assist, 2),
+            "compliance": round(self.compliance, 2),
+            "anomaly_coaching": round(self.anomaly_coaching, 2),
+            "total": round(self.total, 2)
+        }
+
+
+# Quality score keys held as typed fields; any other keys stay in quality_extras
+_QUALITY_FIELDS = ("empathy", "professionalism", "resolution", "compliance",
+                   "escalation_risk", "compliance_status", "violations")
+
+
+@dataclass(slots=True)
 class RealtimeAuditResult:
-    """Result from real-time audit of a segment"""
+    """
+    Result from real-time audit of a segment.
+    Scores, status and warnings are typed fields; the sentiment, suggestion
+    and anomaly payloads are only kept for the segment's own response and
+    dropped by compact() before the result is retained.
+    """
     segment_id: str
-    quality_score: Dict[str, Any]
-    sentiment_analysis: Dict[str, Any]
-    agent_suggestions: Dict[str, Any]
-    compliance_warnings: List[Dict[str, Any]]
-    anomalies: Dict[str, Any]
-    timestamp: str
+    timestamp: float  # epoch seconds
+    empathy: int
+    professionalism: int
+    resolution: int
+    compliance: int
+    escalation_risk: int
+    compliance_status: ComplianceStatus
+    violations: Tuple[str, ...]
+    warnings: Tuple[ComplianceWarning, ...]
+    suggestion_count: int
+    timings: Optional[StageTimings] = None
+    quality_extras: Optional[Dict[str, Any]] = None
+    sentiment_analysis: Optional[Dict[str, Any]] = None
+    agent_suggestions: Optional[Dict[str, Any]] = None
+    anomalies: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_analysis(cls,
+                      segment_id: str,
+                      quality_score: Dict[str, Any],
+                      sentiment_analysis: Dict[str, Any],
+                      agent_suggestions: Dict[str, Any],
+                      warnings: List[ComplianceWarning],
+                      anomalies: Dict[str, Any],
+                      timings: Optional[StageTimings] = None) -> "RealtimeAuditResult":
+        return cls(
+            segment_id=segment_id,
+            timestamp=time.time(),
+            empathy=_score(quality_score.get("empathy")),
+            professionalism=_score(quality_score.get("professionalism")),
+            resolution=_score(quality_score.get("resolution")),
+            compliance=_score(quality_score.get("compliance")),
+            escalation_risk=_score(quality_score.get("escalation_risk")),
+            compliance_status=ComplianceStatus.parse(quality_score.get("compliance_status", "pass")),
+            violations=tuple(quality_score.get("violations", ())),
+            warnings=tuple(warnings),
+            suggestion_count=len(agent_suggestions.get("suggestions", [])),
+            timings=timings,
+            quality_extras={k: v for k, v in quality_score.items() if k not in _QUALITY_FIELDS},
+            sentiment_analysis=sentiment_analysis,
+            agent_suggestions=agent_suggestions,
+            anomalies=anomalies
+        )
+    
+    def compact(self) -> "RealtimeAuditResult":
+        """Copy without the per-response payloads, for retention"""
+        return replace(self, quality_extras=None, sentiment_analysis=None,
+                       agent_suggestions=None, anomalies=None)
+    
+    def quality_dict(self) -> Dict[str, Any]:
+        return {
+            "empathy": self.empathy,
+            "professionalism": self.professionalism,
+            "resolution": self.resolution,
+            "compliance_status": self.compliance_status.label,
+            "compliance": self.compliance,
+            "escalation_risk": self.escalation_risk,
+            "violations": list(self.violations),
+            **(self.quality_extras or {})
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """API view of the segment analysis"""
+        return {
+            "quality": self.quality_dict(),
+            "sentiment": self.sentiment_analysis or {},
+            "suggestions": self.agent_suggestions or {},
+            "warnings": [warning.to_dict() for warning in self.warnings],
+            "anomalies": self.anomalies or {},
+            "timings": self.timings.to_dict() if self.timings else {}
+        }
+
+
+@dataclass(slots=True)
+class SegmentRecord:
+    """Compact summary of one segment's result, kept for its conversation's final report"""
+    segment_id: str
+    timestamp: float
+    empathy: int
+    professionalism: int
+    resolution: int
+    compliance: int
+    escalation_risk: int
+    violations: Tuple[str, ...]
+    warnings: int
+    suggestions: int
+    
+    @classmethod
+    def from_result(cls, result: RealtimeAuditResult) -> "SegmentRecord":
+        return cls(
+            segment_id=result.segment_id,
+            timestamp=result.timestamp,
+            empathy=result.empathy,
+            professionalism=result.professionalism,
+            resolution=result.resolution,
+            compliance=result.compliance,
+            escalation_risk=result.escalation_risk,
+            violations=result.violations,
+            warnings=len(result.warnings),
+            suggestions=result.suggestion_count
+        )
+
+
+@dataclass(slots=True)
+class RunningStats:
+    """Running count, mean, min, max and variance of one metric (Welford's update)"""
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    _mean: float = 0.0
+    _m2: float = 0.0
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    @property
+    def variance(self) -> float:
+        """Population variance"""
+        return self._m2 / self.count if self.count else 0.0
+    
+    def to_dict(self) -> Dict[str, float]:
+        if not self.count:
+            return {"mean": 0.0, "min": 0.0, "max": 0.0, "variance": 0.0, "stddev": 0.0}
+        return {
+            "mean": round(self.mean, 2),
+            "min": self.minimum,
+            "max": self.maximum,
+            "variance": round(self.variance, 2),
+            "stddev": round(math.sqrt(self.variance), 2)
+        }
+
+
+@dataclass
+class ConversationAggregates:
+    """
+    Running aggregates of a conversation's segment results.
+    Each segment is folded in once, so a report (final or mid-call) costs
+    the same however long the call has been running.
+    """
+    METRICS = ("empathy", "professionalism", "resolution", "compliance", "escalation_risk")
+    
+    segments: int = 0
+    stats: Dict[str, RunningStats] = field(
+        default_factory=lambda: {metric: RunningStats() for metric in ConversationAggregates.METRICS}
+    )
+    violations: set = field(default_factory=set)
+    total_warnings: int = 0
+    total_suggestions: int = 0
+    last_escalation_risk: float = 0.0
+    
+    def fold(self, record: SegmentRecord) -> None:
+        self.segments += 1
+        for metric in self.METRICS:
+            self.stats[metric].add(getattr(record, metric))
+        self.violations.update(record.violations)
+        self.total_warnings += record.warnings
+        self.total_suggestions += record.suggestions
+        self.last_escalation_risk = record.escalation_risk
+    
+    def summary(self) -> Dict[str, Any]:
+        avg_compliance = self.stats["compliance"].mean
+        return {
+            "segments_scored": self.segments,
+            "metrics": {
+                "empathy_avg": self.stats["empathy"].mean,
+                "professionalism_avg": self.stats["professionalism"].mean,
+                "compliance_avg": avg_compliance,
+                "resolution_avg": self.stats["resolution"].mean
+            },
+            "metric_stats": {metric: self.stats[metric].to_dict() for metric in self.METRICS},
+            "violations": sorted(self.violations),
+            "violations_found": len(self.violations),
+            "compliance_status": "PASS" if avg_compliance > 80 else "WARN" if avg_compliance > 60 else "FAIL",
+            "escalation_risk": self.last_escalation_risk,
+            "peak_escalation_risk": self.stats["escalation_risk"].maximum if self.segments else 0,
+            "total_warnings": self.total_warnings,
+            "total_suggestions": self.total_suggestions
+        }
+
+
+@dataclass
+class ConversationResults:
+    """One conversation's recent segment records plus running aggregates over all of them"""
+    records: deque
+    aggregates: ConversationAggregates = field(default_factory=ConversationAggregates)
+
+
+class ConversationResultStore:
+    """
+    Segment results indexed by conversation id.
+    Each open conversation keeps a ring buffer of its most recent
+    max_segments compact records (for the timeline) and running aggregates
+    over every segment, separate from the engine's global recent-results
+    feed: other calls can't evict a conversation's results, and ids sharing
+    a prefix (conv_1 / conv_10) never mix.
+    """
+    
+    def __init__(self, max_segments: Optional[int] = None):
+        """
+        Args:
+            max_segments: Records kept per conversation (env AUDIT_RESULTS_PER_CONVERSATION)
+        """
+        self.max_segments = max_segments or int(os.getenv("AUDIT_RESULTS_PER_CONVERSATION", "1000"))
+        self._conversations: Dict[str, ConversationResults] = {}
+        self._lock = threading.Lock()
+    
+    def open(self, conversation_id: str) -> None:
+        with self._lock:
+            self._conversations[conversation_id] = ConversationResults(deque(maxlen=self.max_segments))
+    
+    def add(self, conversation_id: str, result: RealtimeAuditResult) -> None:
+        """Record a result and fold it into the aggregates; ignored if the conversation isn't open"""
+        record = SegmentRecord.from_result(result)
+        with self._lock:
+            results = self._conversations.get(conversation_id)
+            if results is not None:
+                results.records.append(record)
+                results.aggregates.fold(record)
+    
+    def get(self, conversation_id: str) -> List[SegmentRecord]:
+        with self._lock:
+            results = self._conversations.get(conversation_id)
+            return list(results.records) if results else []
+    
+    def latest(self, conversation_id: str) -> Optional[SegmentRecord]:
+        with self._lock:
+            results = self._conversations.get(conversation_id)
+            return results.records[-1] if results and results.records else None
+    
+    def summary(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Aggregates so far, without the timeline"""
+        with self._lock:
+            results = self._conversations.get(conversation_id)
+            return results.aggregates.summary() if results else None
+    
+    def pop(self, conversation_id: str) -> Optional[ConversationResults]:
+        """Remove a conversation, returning its records and aggregates"""
+        with self._lock:
+            return self._conversations.pop(conversation_id, None)
+    
+    def __contains__(self, conversation_id: str) -> bool:
+        return conversation_id in self._conversations
+    
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+
+@dataclass
+class ConversationScoringState:
+    """
+    Per-conversation scoring schedule.
+    Heuristic scores run on every segment; the LLM re-scores the accumulated
+    conversation at most once per scoring_interval, and its latest result is
+    blended into each segment's score. Entering high escalation risk triggers
+    an early re-score, still at most once per interval / 4.
+    """
+    transcript_parts: deque = field(default_factory=deque)
+    transcript_chars: int = 0
+    segments: int = 0
+    last_llm_time: Optional[float] = None
+    llm_score: Optional[Dict[str, Any]] = None
+    llm_scored_segments: int = 0
+    llm_rescores: int = 0
+    segments_since_llm: int = 0
+    high_risk: bool = False
+    
+    def add_text(self, text: str, max_chars: int) -> None:
+        """Append a segment, dropping parts that fall outside the last max_chars"""
+        self.transcript_parts.append(text)
+        self.transcript_chars += len(text) + 1
+        while len(self.transcript_parts) > 1 and \
+                self.transcript_chars - len(self.transcript_parts[0]) - 1 > max_chars:
+            self.transcript_chars -= len(self.transcript_parts.popleft()) + 1
+        self.segments += 1
+        self.segments_since_llm += 1
+    
+    def conversation_text(self, max_chars: int) -> str:
+        """Accumulated conversation, truncated to its most recent max_chars"""
+        text = "\n".join(self.transcript_parts)
+        return text[-max_chars:] if len(text) > max_chars else text
+    
+    def observe_risk(self, high_risk: bool) -> bool:
+        """Track the segment's risk level; True only on the transition into high risk"""
+        entered = high_risk and not self.high_risk
+        self.high_risk = high_risk
+        return entered
+    
+    def llm_due(self, now: float, interval: float, triggered: bool) -> bool:
+        if self.segments_since_llm == 0:
+            return False
+        if self.last_llm_time is None:
+            return True
+        elapsed = now - self.last_llm_time
+        return elapsed >= interval or (triggered and elapsed >= interval / 4)
+    
+    def record_llm(self, score: Dict[str, Any], now: float) -> None:
+        self.llm_score = score
+        self.last_llm_time = now
+        self.llm_scored_segments = self.segments
+        self.llm_rescores += 1
+        self.segments_since_llm = 0
+
+
+@dataclass
+class ConversationSession:
+    """
+    An active conversation: its recent segments and activity bookkeeping.
+    Segments beyond the per-conversation caps are dropped oldest-first;
+    reports use the running aggregates, so only memory is bounded.
+    """
+    agent_id: str
+    started_at: float
+    last_activity: float
+    segments: deque = field(default_factory=deque)
+    segment_count: int = 0
+    bytes_held: int = 0
+    dropped_segments: int = 0
+    
+    def add(self, segment: StreamingSegment, size: int, max_segments: int, max_bytes: int) -> None:
+        self.segments.append((segment, size))
+        self.segment_count += 1
+        self.bytes_held += size
+        while len(self.segments) > 1 and (len(self.segments) > max_segments or self.bytes_held > max_bytes):
+            _, dropped_size = self.segments.popleft()
+            self.bytes_held -= dropped_size
+            self.dropped_segments += 1
 
 
 class RealtimeStreamingAuditEngine:
     """
     Enterprise-grade real-time streaming audit engine.
     Processesconversation segments and performs incremental scoring.
+    
+    Per segment, quality scoring, sentiment, agent assist and RAG compliance
+    are independent and run concurrently; anomaly detection and coaching
+    wait for quality and sentiment. Segment latency is therefore roughly the
+    slowest stage (usually the LLM or the embedding encode), not their sum.
     """
     
+    # Heuristic escalation risk that forces an LLM re-score before the interval elapses
+    ESCALATION_RESCORE_TRIGGER = 60
+    # Weight of the latest LLM conversation score when blended with segment heuristics
+    LLM_SCORE_WEIGHT = 0.7
+    # Most recent characters of the conversation sent for LLM re-scoring
+    MAX_RESCORE_CHARS = 12000
+    
+    # Weighted phrases per heuristic quality dimension
+    QUALITY_KEYWORDS = {
+        "empathy": {
+            "understand": 15, "sorry": 15, "apologize": 15, "appreciate": 12,
+            "concern": 12, "frustrating": 10, "difficult": 10, "feel": 8,
+            "hear you": 15, "completely": 8, "absolutely": 8, "i see": 10,
+            "that must": 12, "let me help": 15, "i can imagine": 12,
+        },
+        "professionalism": {
+            "hello": 12, "please": 10, "thank you": 12, "thanks": 8,
+            "assist": 10, "welcome": 10, "certainly": 10, "happy to": 10,
+            "of course": 8, "good morning": 12, "good afternoon": 12,
+            "good evening": 12, "sir": 8, "ma'am": 8, "madam": 8,
+        },
+        "resolution": {
+            "i will": 12, "let me": 12, "resolve": 15, "fix": 12,
+            "investigate": 12, "look into": 12, "process": 10, "update": 8,
+            "solution": 15, "here's what": 15, "going to": 10, "follow up": 12,
+            "taken care": 12, "next step": 12, "action": 8, "arrange": 10,
+        },
+        "compliance": {
+            "verify": 15, "confirm": 12, "policy": 15, "account number": 12,
+            "security check": 15, "for your safety": 12, "disclaimer": 10,
+            "terms and conditions": 12, "regulation": 10, "compliance": 12,
+            "identity": 10, "authorization": 12, "agreed": 8, "recorded": 10,
+        },
+    }
+    QUALITY_ESCALATION_KEYWORDS = [
+        "angry", "frustrated", "upset", "complaint", "unacceptable",
+        "ridiculous", "worst", "terrible", "outraged", "disgusted",
+        "furious", "never again", "cancel", "lawyer", "sue",
+        "supervisor", "manager", "escalate",
+    ]
+    # Single words checked by the compliance violation rules
+    QUALITY_FLAG_KEYWORDS = ["refund", "policy", "process", "personal", "verify", "confirm"]
+    
     def __init__(self, 
                  enable_llm_analysis: bool = True,
                  scoring_interval: float = 10.0):
@@ -63,25 +549,57 @@ class RealtimeStreamingAuditEngine:
         
         Args:
             enable_llm_analysis: Use LLM for quality scoring (expensive, slower)
-            scoring_interval: Seconds between quality re-scoring
+            scoring_interval: Minimum seconds between LLM re-scores of a conversation
+        
+        The analyzer thread pool size is read from AUDIT_STAGE_WORKERS (default 8).
+        Session limits come from AUDIT_SESSION_IDLE_TTL (seconds, default 900),
+        AUDIT_MAX_ACTIVE_CONVERSATIONS (1000), AUDIT_MAX_SEGMENTS_PER_CONVERSATION
+        (2000) and AUDIT_MAX_BYTES_PER_CONVERSATION (2000000).
         """
         # Core analyzers
         self.llm_manager = LLMManager() if enable_llm_analysis else None
+        # Coalesces concurrent async quality requests across conversations
+        self.quality_batcher = LLMBatchScheduler(self.llm_manager, "quality") if self.llm_manager else None
         self.rag_system = ComplianceRAGEnhanced()
         self.sentiment_analyzer = SentimentEmotionAnalyzer()
         self.anomaly_detector = AnomalyDetectionEngine()
         self.agent_assist = AgentAssistManager()
         self.coaching_engine = AutoCoachingEngine()
+        self.keyword_matcher = get_keyword_matcher()
+        self.keyword_matcher.register("quality", {
+            **{dimension: list(weights) for dimension, weights in self.QUALITY_KEYWORDS.items()},
+            "escalation": self.QUALITY_ESCALATION_KEYWORDS,
+            "flags": self.QUALITY_FLAG_KEYWORDS,
+        })
         
         # Configuration
         self.scoring_interval = scoring_interval
         self.enable_llm = enable_llm_analysis
         
-        # State management
-        self.active_conversations: Dict[str, List[StreamingSegment]] = {}
-        self.audit_results: deque = deque(maxlen=100)  # Keep last 100 results
+        # Threads for the local analyzers of concurrently processed segments
+        # (embedding encode and numpy release the GIL; the rest are short)
+        self.stage_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("AUDIT_STAGE_WORKERS", "8")),
+            thread_name_prefix="audit-stage"
+        )
+        
+        # Session limits
+        self.session_idle_ttl = float(os.getenv("AUDIT_SESSION_IDLE_TTL", "900"))
+        self.max_active_conversations = int(os.getenv("AUDIT_MAX_ACTIVE_CONVERSATIONS", "1000"))
+        self.max_segments_per_conversation = int(os.getenv("AUDIT_MAX_SEGMENTS_PER_CONVERSATION", "2000"))
+        self.max_bytes_per_conversation = int(os.getenv("AUDIT_MAX_BYTES_PER_CONVERSATION", "2000000"))
+        
+        # State management (active conversations in least-recently-active order)
+        self.active_conversations: "OrderedDict[str, ConversationSession]" = OrderedDict()
+        self.scoring_states: Dict[str, ConversationScoringState] = {}
+        self.sentiment_states: Dict[str, ConversationSentimentState] = {}
+        self.result_store = ConversationResultStore()  # Per-conversation results for final reports
+        self.audit_results: deque = deque(maxlen=100)  # Keep last 100 results (recent feed)
         self.alerts: deque = deque(maxlen=500)  # Keep last 500 alerts
+        self.expired_reports: deque = deque(maxlen=100)  # Reports of reaped/evicted sessions
         self.segment_counter = 0
+        self.sessions_reaped = 0
+        self.sessions_evicted = 0
         
         # Callbacks for real-time notifications
         self.alert_callbacks: List[Callable] = []
@@ -93,7 +611,20 @@ class RealtimeStreamingAuditEngine:
             logger.warning(f"Conversation {conversation_id} already active")
             return {"status": "error", "message": "Conversation already active"}
         
-        self.active_conversations[conversation_id] = []
+        # Global cap: finalize the least recently active session to make room
+        while len(self.active_conversations) >= self.max_active_conversations:
+            oldest = next(iter(self.active_conversations))
+            logger.warning(f"Active conversation cap reached; evicting {oldest}")
+            self._expire_conversation(oldest, "evicted")
+            self.sessions_evicted += 1
+        
+        now = time.monotonic()
+        self.active_conversations[conversation_id] = ConversationSession(
+            agent_id=agent_id, started_at=now, last_activity=now
+        )
+        self.scoring_states[conversation_id] = ConversationScoringState()
+        self.sentiment_states[conversation_id] = ConversationSentimentState()
+        self.result_store.open(conversation_id)
         
         logger.info(f"Started tracking conversation {conversation_id} for agent {agent_id}")
         return {
@@ -110,34 +641,64 @@ class RealtimeStreamingAuditEngine:
                    agent_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Add a new segment to active conversation.
-        Triggers incremental scoring every scoring_interval.
+        Heuristic scoring runs every segment; LLM re-scoring of the whole
+        conversation runs at most once per scoring_interval.
         """
         if conversation_id not in self.active_conversations:
             return {"status": "error", "message": "Conversation not found"}
         
-        # Create segment
+        segment = self._create_segment(conversation_id, agent_text, customer_text)
+        
+        # Perform real-time analysis on this segment
+        analysis_result = self._analyze_segment(segment, agent_id, conversation_id)
+        
+        return self._record_result(conversation_id, segment, analysis_result)
+    
+    async def add_segment_async(self,
+                                conversation_id: str,
+                                agent_text: str,
+                                customer_text: str,
+                                agent_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async version of add_segment.
+        Awaits LLM scoring so other conversations keep flowing on the event loop.
+        """
+        if conversation_id not in self.active_conversations:
+            return {"status": "error", "message": "Conversation not found"}
+        
+        segment = self._create_segment(conversation_id, agent_text, customer_text)
+        analysis_result = await self._analyze_segment_async(segment, agent_id, conversation_id)
+        
+        return self._record_result(conversation_id, segment, analysis_result)
+    
+    def _create_segment(self, conversation_id: str, agent_text: str, customer_text: str) -> StreamingSegment:
+        """Create a segment and append it to its conversation"""
         self.segment_counter += 1
         segment = StreamingSegment(
             segment_id=f"{conversation_id}_{self.segment_counter}",
             agent_text=agent_text,
             customer_text=customer_text,
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.time(),
             duration=0.0
         )
         
-        self.active_conversations[conversation_id].append(segment)
-        
-        # Perform real-time analysis on this segment
-        analysis_result = self._analyze_segment(segment, agent_id)
-        
-        # Store result
-        self.audit_results.append(analysis_result)
+        session = self.active_conversations[conversation_id]
+        session.last_activity = time.monotonic()
+        self.active_conversations.move_to_end(conversation_id)
+        size = len(agent_text.encode("utf-8")) + len(customer_text.encode("utf-8"))
+        session.add(segment, size, self.max_segments_per_conversation, self.max_bytes_per_conversation)
+        return segment
+    
+    def _record_result(self, conversation_id: str, segment: StreamingSegment,
+                       analysis_result: RealtimeAuditResult) -> Dict[str, Any]:
+        """Store a segment result, fire callbacks and build the response"""
+        self.audit_results.append(analysis_result.compact())
+        self.result_store.add(conversation_id, analysis_result)
         
         # Trigger callbacks for alerts
-        # Trigger callbacks for alerts
-        if analysis_result.compliance_warnings:
-            for warning in analysis_result.compliance_warnings:
-                self._trigger_alert_callback(warning)
+        if analysis_result.warnings and self.alert_callbacks:
+            for warning in analysis_result.warnings:
+                self._trigger_alert_callback(warning.to_dict())
         
         # Trigger callbacks for suggestions
         if analysis_result.agent_suggestions and analysis_result.agent_suggestions.get("suggestions"):
@@ -150,29 +711,165 @@ class RealtimeStreamingAuditEngine:
             "analysis": self._format_for_response(analysis_result)
         }
     
-    def _analyze_segment(self, segment: StreamingSegment, agent_id: Optional[str] = None) -> RealtimeAuditResult:
+    def _analyze_segment(self, segment: StreamingSegment, agent_id: Optional[str] = None,
+                         conversation_id: Optional[str] = None) -> RealtimeAuditResult:
         """Perform comprehensive analysis on a segment"""
+        started = time.perf_counter()
         
         # Combined text for analysis
         full_text = f"Agent: {segment.agent_text}\nCustomer: {segment.customer_text}"
         
-        # 1. Quality Scoring (fast local scoring, optional LLM)
-        quality_score = self._score_quality(full_text)
+        # 2-4. Local analyzers on the stage pool while quality scoring runs here
+        sentiment = self.stage_executor.submit(
+            self._timed, self._sentiment_stage, segment, full_text, conversation_id
+        )
+        assist = self.stage_executor.submit(self._timed, self._assist_stage, segment, full_text)
+        compliance = self.stage_executor.submit(self._timed, self._compliance_stage, full_text)
+        
+        # 1. Quality Scoring (heuristic every segment, scheduled LLM re-score)
+        quality = self._timed(self._quality_stage, full_text, conversation_id)
         
-        # 2. Sentiment & Emotion Analysis
-        sentiment_analysis = self.sentiment_analyzer.comprehensive_analysis(full_text)
+        return self._complete_analysis(
+            segment, agent_id, started,
+            quality=quality,
+            sentiment=sentiment.result(),
+            assist=assist.result(),
+            compliance=compliance.result()
+        )
+    
+    async def _analyze_segment_async(self, segment: StreamingSegment, agent_id: Optional[str] = None,
+                                     conversation_id: Optional[str] = None) -> RealtimeAuditResult:
+        """Analyze a segment, awaiting any scheduled LLM re-score alongside the local analyzers"""
+        started = time.perf_counter()
+        full_text = f"Agent: {segment.agent_text}\nCustomer: {segment.customer_text}"
+        
+        loop = asyncio.get_running_loop()
+        quality, sentiment, assist, compliance = await asyncio.gather(
+            self._timed_async(self._quality_stage_async(full_text, conversation_id)),
+            loop.run_in_executor(self.stage_executor, self._timed,
+                                 self._sentiment_stage, segment, full_text, conversation_id),
+            loop.run_in_executor(self.stage_executor, self._timed, self._assist_stage, segment, full_text),
+            loop.run_in_executor(self.stage_executor, self._timed, self._compliance_stage, full_text)
+        )
         
-        # 3. Agent Assist suggestions
+        return self._complete_analysis(
+            segment, agent_id, started,
+            quality=quality, sentiment=sentiment, assist=assist, compliance=compliance
+        )
+    
+    @staticmethod
+    def _timed(stage: Callable, *args) -> Tuple[Any, float]:
+        """Run a stage and return (result, elapsed ms)"""
+        started = time.perf_counter()
+        return stage(*args), (time.perf_counter() - started) * 1000
+    
+    @staticmethod
+    async def _timed_async(stage) -> Tuple[Any, float]:
+        started = time.perf_counter()
+        return await stage, (time.perf_counter() - started) * 1000
+    
+    def _quality_stage(self, full_text: str, conversation_id: Optional[str]) -> Dict[str, Any]:
+        """Heuristic score, blended with the conversation's latest LLM re-score"""
+        state = self.scoring_states.get(conversation_id)
+        heuristic = self._heuristic_quality_score(full_text)
+        if state is None:
+            return self._score_quality(full_text)
+        if self._llm_rescore_due(state, full_text, heuristic):
+            llm_score = self._llm_quality(state.conversation_text(self.MAX_RESCORE_CHARS))
+            if llm_score is not None:
+                state.record_llm(llm_score, time.monotonic())
+        return self._merge_quality_scores(heuristic, state)
+    
+    async def _quality_stage_async(self, full_text: str, conversation_id: Optional[str]) -> Dict[str, Any]:
+        state = self.scoring_states.get(conversation_id)
+        heuristic = self._heuristic_quality_score(full_text)
+        if state is None:
+            return await self._score_quality_async(full_text)
+        if self._llm_rescore_due(state, full_text, heuristic):
+            llm_score = await self._llm_quality_async(state.conversation_text(self.MAX_RESCORE_CHARS))
+            if llm_score is not None:
+                state.record_llm(llm_score, time.monotonic())
+        return self._merge_quality_scores(heuristic, state)
+    
+    def _sentiment_stage(self, segment: StreamingSegment, full_text: str,
+                         conversation_id: Optional[str]) -> Dict[str, Any]:
+        """Sentiment & emotion, folded into the conversation's running state"""
+        sentiment_state = self.sentiment_states.get(conversation_id)
+        if sentiment_state is None:
+            return self.sentiment_analyzer.comprehensive_analysis(full_text)
+        return self.sentiment_analyzer.analyze_segment(
+            sentiment_state, full_text, segment.agent_text, segment.customer_text
+        )
+    
+    def _assist_stage(self, segment: StreamingSegment, full_text: str) -> Dict[str, Any]:
         agent_assist_result = self.agent_assist.process_turn(
             segment.agent_text, segment.customer_text, full_text
         )
-        agent_suggestions = agent_assist_result.get("turn_analysis", {})
-        
-        # 4. Compliance Warnings (RAG-based)
+        return agent_assist_result.get("turn_analysis", {})
+    
+    def _compliance_stage(self, full_text: str) -> List[ComplianceWarning]:
+        """RAG-based compliance warnings"""
         rag_result = self.rag_system.validate_compliance(full_text)
-        compliance_warnings = self._format_compliance_warnings(rag_result)
+        return self._format_compliance_warnings(rag_result)
+    
+    def _llm_rescore_due(self, state: ConversationScoringState, segment_text: str,
+                         heuristic: Dict[str, Any]) -> bool:
+        """Add the segment to the conversation and decide whether the LLM should re-score it"""
+        state.add_text(segment_text, self.MAX_RESCORE_CHARS)
+        triggered = state.observe_risk(heuristic.get("escalation_risk", 0) >= self.ESCALATION_RESCORE_TRIGGER)
+        if not (self.llm_manager and self.enable_llm):
+            return False
+        now = time.monotonic()
+        if not state.llm_due(now, self.scoring_interval, triggered):
+            return False
+        # Claim the slot up front so failures and concurrent segments are debounced too
+        state.last_llm_time = now
+        return True
+    
+    def _merge_quality_scores(self, heuristic: Dict[str, Any],
+                              state: ConversationScoringState) -> Dict[str, Any]:
+        """Blend this segment's heuristic score with the latest LLM conversation score"""
+        llm_score = state.llm_score
+        if not llm_score:
+            return {**heuristic, "scoring_source": "heuristic"}
+        
+        merged = dict(heuristic)
+        weight = self.LLM_SCORE_WEIGHT
+        for metric in ("empathy", "professionalism", "resolution", "compliance"):
+            llm_value = llm_score.get(metric)
+            if isinstance(llm_value, (int, float)):
+                merged[metric] = round(weight * llm_value + (1 - weight) * heuristic.get(metric, 0))
+        
+        # Risk signals take the worse of the two views
+        llm_risk = llm_score.get("escalation_risk")
+        if isinstance(llm_risk, (int, float)):
+            merged["escalation_risk"] = max(heuristic.get("escalation_risk", 0), llm_risk)
+        status_rank = {"pass": 0, "warn": 1, "fail": 2}
+        llm_status = str(llm_score.get("compliance_status", "pass")).lower()
+        if status_rank.get(llm_status, 0) > status_rank.get(heuristic.get("compliance_status", "pass"), 0):
+            merged["compliance_status"] = llm_status
+        
+        for key in ("key_issues", "strengths", "recommendations"):
+            if llm_score.get(key):
+                merged[key] = llm_score[key]
+        
+        merged["scoring_source"] = "blended"
+        merged["llm_scored_segments"] = state.llm_scored_segments
+        return merged
+    
+    def _complete_analysis(self,
+                           segment: StreamingSegment,
+                           agent_id: Optional[str],
+                           started: float,
+                           quality: Tuple[Dict[str, Any], float],
+                           sentiment: Tuple[Dict[str, Any], float],
+                           assist: Tuple[Dict[str, Any], float],
+                           compliance: Tuple[List[ComplianceWarning], float]) -> RealtimeAuditResult:
+        """Join the concurrent stages (each a (result, ms) pair) for anomaly detection and coaching"""
+        quality_score, sentiment_analysis = quality[0], sentiment[0]
         
         # 5. Anomaly Detection
+        joined = time.perf_counter()
         anomalies = self.anomaly_detector.process_audit_result(
             quality_score, sentiment_analysis, agent_id
         )
@@ -180,70 +877,85 @@ class RealtimeStreamingAuditEngine:
         # Store for coaching analysis
         if agent_id:
             self.coaching_engine.process_audit(agent_id, quality_score, sentiment_analysis)
+        finished = time.perf_counter()
         
-        return RealtimeAuditResult(
-            segment_id=segment.segment_id,
-            quality_score=quality_score,
-            sentiment_analysis=sentiment_analysis,
-            agent_suggestions=agent_suggestions,
-            compliance_warnings=compliance_warnings,
-            anomalies=anomalies,
-            timestamp=datetime.now().isoformat()
+        return RealtimeAuditResult.from_analysis(
+            segment.segment_id,
+            quality_score,
+            sentiment_analysis,
+            assist[0],
+            compliance[0],
+            anomalies,
+            StageTimings(
+                quality=quality[1],
+                sentiment=sentiment[1],
+                agent_assist=assist[1],
+                compliance=compliance[1],
+                anomaly_coaching=(finished - joined) * 1000,
+                total=(finished - started) * 1000
+            )
         )
     
     def _score_quality(self, text: str) -> Dict[str, Any]:
         """Score conversation quality (fast local scoring)"""
         # Use LLM if enabled, otherwise use fast heuristic scoring
-        
-        if self.llm_manager and self.enable_llm:
-            try:
-                result = self.llm_manager.analyze_text(text, "quality")
-                return result
-            except Exception as e:
-                logger.warning(f"LLM analysis failed, using fallback: {e}")
+        result = self._llm_quality(text)
         
         # Fallback: Fast heuristic scoring
-        return self._heuristic_quality_score(text)
+        return result if result is not None else self._heuristic_quality_score(text)
+    
+    async def _score_quality_async(self, text: str) -> Dict[str, Any]:
+        """Score conversation quality without blocking the event loop"""
+        result = await self._llm_quality_async(text)
+        return result if result is not None else self._heuristic_quality_score(text)
+    
+    def _llm_quality(self, text: str) -> Optional[Dict[str, Any]]:
+        """LLM quality score, or None if disabled or unavailable"""
+        if not (self.llm_manager and self.enable_llm):
+            return None
+        try:
+            result = self.llm_manager.analyze_text(text, "quality")
+            return None if "error" in result else result
+        except (CircuitOpenError, RateLimitedError) as e:
+            logger.debug(f"LLM unavailable, using fallback: {e}")
+        except Exception as e:
+            logger.warning(f"LLM analysis failed, using fallback: {e}")
+        return None
+    
+    async def _llm_quality_async(self, text: str) -> Optional[Dict[str, Any]]:
+        """Async LLM quality score via the micro-batcher, or None if unavailable"""
+        if not (self.llm_manager and self.enable_llm):
+            return None
+        try:
+            result = await self.quality_batcher.submit(text)
+            return None if "error" in result else result
+        except (CircuitOpenError, RateLimitedError) as e:
+            logger.debug(f"LLM unavailable, using fallback: {e}")
+        except Exception as e:
+            logger.warning(f"LLM analysis failed, using fallback: {e}")
+        return None
     
     def _heuristic_quality_score(self, text: str) -> Dict[str, Any]:
         """
         Keyword-based quality scoring computed dynamically from transcript.
         No hardcoded scores — all values derived from conversation content.
         """
-        text_lower = text.lower()
-        words = text_lower.split()
+        words = text.lower().split()
         word_count = max(len(words), 1)
+        hits = self.keyword_matcher.scan(text)
+        
+        def weighted(dimension: str) -> int:
+            weights = self.QUALITY_KEYWORDS[dimension]
+            return sum(weights[phrase] for phrase in hits.found("quality", dimension))
         
         # ── Empathy scoring ──
-        empathy_keywords = {
-            "understand": 15, "sorry": 15, "apologize": 15, "appreciate": 12,
-            "concern": 12, "frustrating": 10, "difficult": 10, "feel": 8,
-            "hear you": 15, "completely": 8, "absolutely": 8, "i see": 10,
-            "that must": 12, "let me help": 15, "i can imagine": 12,
-        }
-        empathy_score = 0
-        empathy_matches = []
-        for phrase, weight in empathy_keywords.items():
-            if phrase in text_lower:
-                empathy_score += weight
-                empathy_matches.append(phrase)
+        empathy_score = weighted("empathy")
         # Base score from text length (longer = more conversation = more opportunity)
         empathy_base = min(30, word_count // 5)
         empathy = min(100, empathy_base + empathy_score)
         
         # ── Professionalism scoring ──
-        prof_keywords = {
-            "hello": 12, "please": 10, "thank you": 12, "thanks": 8,
-            "assist": 10, "welcome": 10, "certainly": 10, "happy to": 10,
-            "of course": 8, "good morning": 12, "good afternoon": 12,
-            "good evening": 12, "sir": 8, "ma'am": 8, "madam": 8,
-        }
-        prof_score = 0
-        prof_matches = []
-        for phrase, weight in prof_keywords.items():
-            if phrase in text_lower:
-                prof_score += weight
-                prof_matches.append(phrase)
+        prof_score = weighted("professionalism")
         # Penalty for unprofessional markers
         if "!" in text and text.count("!") > 2:
             prof_score -= 10
@@ -251,57 +963,29 @@ class RealtimeStreamingAuditEngine:
         professionalism = min(100, max(0, prof_base + prof_score))
         
         # ── Resolution scoring ──
-        resolution_keywords = {
-            "i will": 12, "let me": 12, "resolve": 15, "fix": 12,
-            "investigate": 12, "look into": 12, "process": 10, "update": 8,
-            "solution": 15, "here's what": 15, "going to": 10, "follow up": 12,
-            "taken care": 12, "next step": 12, "action": 8, "arrange": 10,
-        }
-        resolution_score = 0
-        resolution_matches = []
-        for phrase, weight in resolution_keywords.items():
-            if phrase in text_lower:
-                resolution_score += weight
-                resolution_matches.append(phrase)
+        resolution_score = weighted("resolution")
         resolution_base = min(25, word_count // 6)
         resolution = min(100, resolution_base + resolution_score)
         
         # ── Compliance scoring ──
-        compliance_keywords = {
-            "verify": 15, "confirm": 12, "policy": 15, "account number": 12,
-            "security check": 15, "for your safety": 12, "disclaimer": 10,
-            "terms and conditions": 12, "regulation": 10, "compliance": 12,
-            "identity": 10, "authorization": 12, "agreed": 8, "recorded": 10,
-        }
-        compliance_score = 0
-        compliance_matches = []
-        for phrase, weight in compliance_keywords.items():
-            if phrase in text_lower:
-                compliance_score += weight
-                compliance_matches.append(phrase)
+        compliance_score = weighted("compliance")
         compliance_base = min(30, word_count // 5)
         compliance_total = min(100, compliance_base + compliance_score)
         
         # Compliance violations
         violations = []
         compliance_status = "pass"
-        if "refund" in text_lower and "policy" not in text_lower and "process" not in text_lower:
+        if hits.has("refund") and not hits.has("policy") and not hits.has("process"):
             violations.append("Refund discussed without policy reference")
             compliance_status = "warn"
-        if "personal" in text_lower and "verify" not in text_lower and "confirm" not in text_lower:
+        if hits.has("personal") and not hits.has("verify") and not hits.has("confirm"):
             violations.append("Personal data mentioned without verification step")
             compliance_status = "warn"
         if violations:
             compliance_total = max(0, compliance_total - len(violations) * 10)
         
         # ── Escalation risk ──
-        escalation_keywords = [
-            "angry", "frustrated", "upset", "complaint", "unacceptable",
-            "ridiculous", "worst", "terrible", "outraged", "disgusted",
-            "furious", "never again", "cancel", "lawyer", "sue",
-            "supervisor", "manager", "escalate",
-        ]
-        escalation_hits = sum(1 for kw in escalation_keywords if kw in text_lower)
+        escalation_hits = hits.count("quality", "escalation")
         escalation_risk = min(100, escalation_hits * 15)
         
         # ── Strengths and recommendations ──
@@ -340,20 +1024,17 @@ class RealtimeStreamingAuditEngine:
             "recommendations": [r for r in recommendations if r],
         }
     
-    def _format_compliance_warnings(self, rag_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _format_compliance_warnings(self, rag_result: Dict[str, Any]) -> List[ComplianceWarning]:
         """Convert RAG results to compliance warnings"""
-        warnings = []
-        
-        for violation in rag_result.get("violations", []):
-            warnings.append({
-                "level": "warning" if violation["severity"] == "medium" else violation["severity"],
-                "policy": violation["policy"],
-                "message": f"Potential {violation['severity']} violation: {violation['policy']}",
-                "guidance": violation.get("guidance", ""),
-                "relevance_score": violation["relevance_score"]
-            })
-        
-        return warnings
+        return [
+            ComplianceWarning(
+                severity=Severity.parse(violation["severity"]),
+                policy=violation["policy"],
+                relevance_score=violation["relevance_score"],
+                guidance=violation.get("guidance", "")
+            )
+            for violation in rag_result.get("violations", [])
+        ]
     
     def end_conversation(self, conversation_id: str, agent_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -363,13 +1044,16 @@ class RealtimeStreamingAuditEngine:
         if conversation_id not in self.active_conversations:
             return {"status": "error", "message": "Conversation not found"}
         
-        segments = self.active_conversations.pop(conversation_id)
+        session = self.active_conversations.pop(conversation_id)
+        self.scoring_states.pop(conversation_id, None)
+        sentiment_state = self.sentiment_states.pop(conversation_id, None)
+        results = self.result_store.pop(conversation_id)
         
-        if not segments:
+        if not session.segment_count:
             return {"status": "error", "message": "No segments in conversation"}
         
         # Generate final report
-        final_report = self._generate_final_report(conversation_id, segments)
+        final_report = self._generate_final_report(conversation_id, session, results, sentiment_state)
         
         # Trigger coaching plan generation if needed
         coaching_plan = None
@@ -385,51 +1069,105 @@ class RealtimeStreamingAuditEngine:
             "timestamp": datetime.now().isoformat()
         }
     
-    def _generate_final_report(self, conversation_id: str, segments: List[StreamingSegment]) -> Dict[str, Any]:
-        """Generate comprehensive final audit report"""
-        
-        # Aggregate metrics from all segments
-        all_results = [r for r in self.audit_results if r.segment_id.startswith(conversation_id)]
-        
-        if not all_results:
+    def discard_conversation(self, conversation_id: str) -> bool:
+        """Drop all state for a conversation without reporting; True if it was active"""
+        self.scoring_states.pop(conversation_id, None)
+        self.sentiment_states.pop(conversation_id, None)
+        self.result_store.pop(conversation_id)
+        return self.active_conversations.pop(conversation_id, None) is not None
+    
+    def _expire_conversation(self, conversation_id: str, reason: str) -> None:
+        """Finalize a session the client never ended, keeping its report in expired_reports"""
+        result = self.end_conversation(conversation_id)
+        if result.get("status") == "success":
+            self.expired_reports.append({**result, "reason": reason})
+        logger.info(f"Conversation {conversation_id} {reason}")
+    
+    def reap_idle_sessions(self, now: Optional[float] = None) -> List[str]:
+        """Finalize sessions with no activity for session_idle_ttl seconds"""
+        now = time.monotonic() if now is None else now
+        idle = []
+        # Least recently active first; stop at the first session still in use
+        for conversation_id, session in self.active_conversations.items():
+            if now - session.last_activity < self.session_idle_ttl:
+                break
+            idle.append(conversation_id)
+        for conversation_id in idle:
+            self._expire_conversation(conversation_id, "idle")
+        self.sessions_reaped += len(idle)
+        return idle
+    
+    async def run_session_reaper(self, interval: float = 30.0) -> None:
+        """Reap idle sessions every interval seconds; run as a task on the serving event loop"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                reaped = self.reap_idle_sessions()
+                if reaped:
+                    logger.info(f"Reaped {len(reaped)} idle conversations")
+            except Exception as e:
+                logger.error(f"Session reaper error: {e}")
+    
+    def session_gauges(self) -> Dict[str, Any]:
+        """Session counts and memory held by active conversations"""
+        sessions = self.active_conversations.values()
+        return {
+            "active_sessions": len(self.active_conversations),
+            "max_active_sessions": self.max_active_conversations,
+            "segments_held": sum(len(s.segments) for s in sessions),
+            "bytes_held": sum(s.bytes_held for s in sessions),
+            "segments_dropped": sum(s.dropped_segments for s in sessions),
+            "sessions_reaped": self.sessions_reaped,
+            "sessions_evicted": self.sessions_evicted,
+            "idle_ttl_seconds": self.session_idle_ttl
+        }
+    
+    def get_conversation_report(self, conversation_id: str) -> Dict[str, Any]:
+        """Report so far for an active conversation, from its running aggregates"""
+        summary = self.result_store.summary(conversation_id)
+        if summary is None:
+            return {"status": "error", "message": "Conversation not found"}
+        sentiment_state = self.sentiment_states.get(conversation_id)
+        if sentiment_state is not None:
+            with sentiment_state.lock:
+                summary["sentiment_summary"] = sentiment_state.snapshot()
+        return {
+            "status": "success",
+            "conversation_id": conversation_id,
+            "segments_received": self.active_conversations[conversation_id].segment_count
+            if conversation_id in self.active_conversations else 0,
+            "report": summary,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _generate_final_report(self, conversation_id: str, session: ConversationSession,
+                               results: Optional[ConversationResults],
+                               sentiment_state: Optional[ConversationSentimentState] = None) -> Dict[str, Any]:
+        """Generate comprehensive final audit report from the conversation's running aggregates"""
+        if results is None or not results.aggregates.segments:
             return {"error": "No results available"}
         
-        # Calculate aggregates
-        empathy_scores = [r.quality_score.get("empathy", 0) for r in all_results]
-        professionalism_scores = [r.quality_score.get("professionalism", 0) for r in all_results]
-        resolution_scores = [r.quality_score.get("resolution", 0) for r in all_results]
-        compliance_scores = [r.quality_score.get("compliance", 0) for r in all_results]
-        
-        avg_empathy = sum(empathy_scores) / len(empathy_scores) if empathy_scores else 0
-        avg_professionalism = sum(professionalism_scores) / len(professionalism_scores) if professionalism_scores else 0
-        avg_resolution = sum(resolution_scores) / len(resolution_scores) if resolution_scores else 0
-        avg_compliance = sum(compliance_scores) / len(compliance_scores) if compliance_scores else 0
-        
-        # Collect all violations
-        all_violations = []
-        for result in all_results:
-            all_violations.extend(result.quality_score.get("violations", []))
-        
+        summary = results.aggregates.summary()
         return {
             "conversation_id": conversation_id,
-            "segments_analyzed": len(segments),
-            "metrics": {
-                "empathy_avg": avg_empathy,
-                "professionalism_avg": avg_professionalism,
-                "compliance_avg": avg_compliance,
-                "resolution_avg": avg_resolution
-            },
-            "violations_found": len(set(all_violations)),
-            "compliance_status": "PASS" if avg_compliance > 80 else "WARN" if avg_compliance > 60 else "FAIL",
-            "total_warnings": sum(len(r.compliance_warnings) for r in all_results),
-            "total_suggestions": sum(len(r.agent_suggestions.get("suggestions", [])) for r in all_results),
+            "segments_analyzed": session.segment_count,
+            "metrics": summary["metrics"],
+            "metric_stats": summary["metric_stats"],
+            "violations_found": summary["violations_found"],
+            "compliance_status": summary["compliance_status"],
+            "escalation_risk": summary["escalation_risk"],
+            "peak_escalation_risk": summary["peak_escalation_risk"],
+            "total_warnings": summary["total_warnings"],
+            "total_suggestions": summary["total_suggestions"],
+            "sentiment_summary": sentiment_state.snapshot() if sentiment_state else None,
+            # Most recent AUDIT_RESULTS_PER_CONVERSATION segments
             "segment_timeline": [
                 {
-                    "segment": s.segment_id,
-                    "compliance_score": r.quality_score.get("compliance", 0),
-                    "timestamp": r.timestamp
+                    "segment": r.segment_id,
+                    "compliance_score": r.compliance,
+                    "timestamp": _iso(r.timestamp)
                 }
-                for s, r in zip(segments, all_results)
+                for r in results.records
             ]
         }
     
@@ -459,24 +1197,22 @@ class RealtimeStreamingAuditEngine:
     
     def _format_for_response(self, result: RealtimeAuditResult) -> Dict[str, Any]:
         """Format analysis result for API response"""
-        return {
-            "quality": result.quality_score,
-            "sentiment": result.sentiment_analysis,
-            "suggestions": result.agent_suggestions,
-            "warnings": result.compliance_warnings,
-            "anomalies": result.anomalies
-        }
+        return result.to_dict()
     
     def get_active_conversations(self) -> Dict[str, Any]:
         """Get list of active conversations"""
+        now = time.monotonic()
         return {
             "active_count": len(self.active_conversations),
             "conversations": [
                 {
                     "conversation_id": cid,
-                    "segments": len(segments)
+                    "agent_id": session.agent_id,
+                    "segments": session.segment_count,
+                    "idle_seconds": round(now - session.last_activity, 1),
+                    "llm_rescores": self.scoring_states[cid].llm_rescores if cid in self.scoring_states else 0
                 }
-                for cid, segments in self.active_conversations.items()
+                for cid, session in self.active_conversations.items()
             ]
         }
     
@@ -485,6 +1221,8 @@ class RealtimeStreamingAuditEngine:
         return {
             "status": "operational",
             "active_conversations": len(self.active_conversations),
+            "tracked_conversations": len(self.result_store),
+            "sessions": self.session_gauges(),
             "total_alerts": len(self.alerts),
             "total_results": len(self.audit_results),
             "components": {
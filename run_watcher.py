@@ -41,6 +41,7 @@ def main():
         logger.info("Stopping watcher...")
         observer.stop()
     observer.join()
+    event_handler.close()
 
 if __name__ == "__main__":
     main()